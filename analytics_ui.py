@@ -3,9 +3,15 @@ import pandas as pd
 from datetime import datetime
 import calendar
 
+from fragments import rerun_fragment
+
 def render_analytics_page(manager):
     st.header("Analytics & Monthly Wrapped 🎁")
-    
+    _render_monthly_wrapped(manager)
+
+@st.fragment
+def _render_monthly_wrapped(manager):
+    """Controls, score and chart as a fragment: picking a month only reruns this section."""
     # --- CONTROLS ---
     col_sel1, col_sel2 = st.columns(2)
     with col_sel1:
@@ -65,6 +71,10 @@ def render_analytics_page(manager):
         st.warning(f"## ⚠️ Score: {total_score}/100 - Needs Improvement")
         st.write("A bit of a slow month? Let's reset and get back on track.")
 
+    # --- STREAKS ---
+    st.divider()
+    _render_streaks(manager)
+
     # --- CALORIE CHART ---
     st.divider()
     st.subheader("Daily Calories vs Limit")
@@ -82,3 +92,34 @@ def render_analytics_page(manager):
         st.bar_chart(df[["Calories", "Limit"]])
     else:
         st.info("No calorie data available for this month.")
+
+STREAK_LABELS = {
+    "workout": "🏋️ Workouts",
+    "calories": "🍎 Under Calorie Limit",
+    "tasks": "✅ Tasks Completed"
+}
+
+def _render_streaks(manager):
+    st.subheader("Streaks & Consistency")
+    streaks = manager.get_streaks()
+
+    cols = st.columns(len(STREAK_LABELS))
+    for col, (metric, label) in zip(cols, STREAK_LABELS.items()):
+        with col:
+            st.metric(label, f"{streaks[metric]['current']} days",
+                      delta=f"Best: {streaks[metric]['longest']}", delta_color="off")
+
+    with st.expander("Streak Settings"):
+        st.caption("Missed days allowed before a streak breaks (e.g. 1 = rest days are fine).")
+        with st.form("streak_settings"):
+            gaps = {}
+            for metric, label in STREAK_LABELS.items():
+                gaps[metric] = st.number_input(label, min_value=0, max_value=7,
+                                               value=int(streaks[metric]["gap"]))
+            if st.form_submit_button("Save"):
+                # One batch: streaks and summary are written once, however many gaps changed
+                with manager.batch():
+                    for metric, gap in gaps.items():
+                        if gap != streaks[metric]["gap"]:
+                            manager.set_streak_gap(metric, gap)
+                rerun_fragment()
@@ -4,6 +4,8 @@ from datetime import datetime
 
 # Import modules
 from data_manager import DataManager
+from github_client import GitHubError
+import snapshots
 from profile_ui import render_profile_page
 from tasks_ui import render_tasks_page
 from health_ui import render_health_page
@@ -15,6 +17,12 @@ def main():
     
     # Initialize Data Manager
     dm = DataManager()
+    # Hourly point-in-time backup of the data directory (only changed chunks are stored)
+    try:
+        snapshots.maybe_snapshot(dm)
+    except (OSError, ValueError) as e:
+        # A failed backup must not take the page down
+        st.sidebar.warning(f"Snapshot failed: {e}")
     
     # --- NAVIGATION ---
     st.sidebar.title("LifeTracker")
@@ -34,25 +42,34 @@ def main():
     
     st.sidebar.divider()
     st.sidebar.caption(f"📅 {datetime.now().strftime('%B %d, %Y')}")
+    if dm.cloud_mode:
+        stats = dm.get_cloud_stats()
+        st.sidebar.caption(f"☁️ GitHub: {stats['requests']} requests this session "
+                           f"({stats['not_modified']} cached), {stats['rate_remaining']} left this hour")
 
     # --- ROUTING ---
-    if page == "home":
-        render_home_dashboard(dm)
-    elif page == "tasks":
-        render_tasks_page(dm)
-    elif page == "health":
-        render_health_page(dm)
-    elif page == "journal":
-        render_journal_page(dm)
-    elif page == "analytics":
-        render_analytics_page(dm)
-    elif page == "profile":
-        render_profile_page(dm)
+    try:
+        if page == "home":
+            render_home_dashboard(dm)
+        elif page == "tasks":
+            render_tasks_page(dm)
+        elif page == "health":
+            render_health_page(dm)
+        elif page == "journal":
+            render_journal_page(dm)
+        elif page == "analytics":
+            render_analytics_page(dm)
+        elif page == "profile":
+            render_profile_page(dm)
+    except GitHubError as e:
+        # Cloud reads and writes fail loudly rather than fall back to empty data
+        st.error(f"GitHub: {e}")
 
 def render_home_dashboard(manager):
     """Renders the Home Dashboard with At-a-Glance stats."""
-    profile = manager.load_data("profile")
-    user_name = profile.get("name", "User")
+    # One small read: the summary is kept current by every DataManager save
+    summary = manager.get_today_summary()
+    user_name = summary.get("name", "User")
     
     st.title(f"Welcome back, {user_name}! 👋")
     
@@ -73,14 +90,11 @@ def render_home_dashboard(manager):
     
     # Calculations
     # 1. Tasks Left
-    tasks = manager.load_data("tasks")
-    pending_count = len([t for t in tasks if t.get("status") == "Pending"])
+    pending_count = summary.get("pending_tasks", 0)
     
     # 2. Calories Remaining
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    health_entry = manager.get_daily_health_entry(today_str)
-    consumed_cals = sum(item["calories"] for item in health_entry.get("food_entries", []))
-    limit_cals = profile.get("calorie_limit", 2000)
+    consumed_cals = summary.get("calories_consumed", 0)
+    limit_cals = summary.get("calorie_limit", 2000)
     remaining_cals = limit_cals - consumed_cals
     
     # Display Stats
@@ -100,10 +114,28 @@ def render_home_dashboard(manager):
         
     with col3:
         # Maybe show current weight gap?
-        curr = profile.get("current_weight", 0)
-        goal = profile.get("goal_weight", 0)
+        curr = summary.get("current_weight", 0)
+        goal = summary.get("goal_weight", 0)
         gap = round(curr - goal, 1)
         st.metric("Weight Gap", f"{gap} kg", help="Difference from goal weight")
+        if summary.get("workout_completed"):
+            st.caption("🏋️ Workout done today.")
+        else:
+            st.caption("No workout logged yet today.")
+
+    # --- STREAKS ---
+    st.subheader("Streaks 🔥")
+    streaks = manager.get_streaks(summary)
+    s1, s2, s3 = st.columns(3)
+    with s1:
+        st.metric("Workout Streak", f"{streaks['workout']['current']} days",
+                  help=f"Longest: {streaks['workout']['longest']} days")
+    with s2:
+        st.metric("Under Calorie Limit", f"{streaks['calories']['current']} days",
+                  help=f"Longest: {streaks['calories']['longest']} days")
+    with s3:
+        st.metric("Task Streak", f"{streaks['tasks']['current']} days",
+                  help=f"Longest: {streaks['tasks']['longest']} days")
 
     # --- ILLUSTRATION / CALL TO ACTION ---
     st.divider()
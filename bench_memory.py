@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: plain JSON dicts vs the compact records in models.py,
+on a synthetic 10-year dataset.
+
+    python bench_memory.py [--years 10]
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import tempfile
+import tracemalloc
+from datetime import date, timedelta
+
+import models
+
+FOODS = ["Idly", "Dosa", "Oats", "Chicken Salad", "Rice & Dal", "Protein Shake", "Apple", "Paneer Wrap"]
+CATEGORIES = ["Daily Goal", "Work", "Study"]
+ACTIONS = ["FOOD_LOG", "WORKOUT_LOG", "WEIGHT_LOG", "TASK_ADD", "TASK_COMPLETE", "JOURNAL_ADD"]
+
+
+def generate_dataset(years, seed=42):
+    """Returns {"health", "tasks", "history"} JSON strings shaped like the files in data/."""
+    rng = random.Random(seed)
+    start = date.today() - timedelta(days=365 * years)
+    health, tasks, history = [], [], []
+
+    for offset in range(365 * years):
+        day = (start + timedelta(days=offset)).strftime("%Y-%m-%d")
+        foods = [{"name": rng.choice(FOODS), "calories": rng.randrange(100, 900, 10)}
+                 for _ in range(rng.randint(2, 5))]
+        health.append({
+            "date": day,
+            "food_entries": foods,
+            "workout_completed": rng.random() < 0.5,
+            "weight_log": round(rng.uniform(80, 110), 1) if rng.random() < 0.3 else None
+        })
+        for n in range(rng.randint(1, 3)):
+            done = rng.random() < 0.8
+            tasks.append({
+                "name": f"Task {offset}-{n}",
+                "category": rng.choice(CATEGORIES),
+                "status": "Done" if done else "Pending",
+                "created_date": day,
+                "completed_date": day if done else None
+            })
+        for n in range(len(foods) + rng.randint(1, 4)):
+            action = rng.choice(ACTIONS)
+            history.append({
+                "timestamp": f"{day}T{8 + n:02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}.{rng.randint(0, 999999):06d}",
+                "action_type": action,
+                "details": f"{action.title()} #{n}"
+            })
+
+    return {key: json.dumps(value) for key, value in
+            (("health", health), ("tasks", tasks), ("history", history))}
+
+
+def measure(build):
+    """Bytes still allocated by the object `build()` returns."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def measure_peak(build):
+    """Highest allocation while `build()` runs (what a rerun actually pays for)."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return peak
+
+
+def bench_data_manager(dataset):
+    """Peak memory of DataManager.load_data vs the streaming load_records, from disk."""
+    from data_manager import DataManager
+
+    with tempfile.TemporaryDirectory() as tmp:
+        DataManager.DATA_DIR = tmp
+        manager = DataManager()
+        for key, raw in dataset.items():
+            with open(os.path.join(tmp, DataManager.FILES[key]), "w") as f:
+                json.dump(json.loads(raw), f, indent=4)
+
+        print(f"\n{'collection':<10} {'load_data peak':>15} {'load_records peak':>18} {'saving':>7}")
+        for key in dataset:
+            dict_peak = measure_peak(lambda: manager.load_data(key))
+            record_peak = measure_peak(lambda: manager.load_records(key))
+            print(f"{key:<10} {dict_peak / 1e6:>12.2f} MB {record_peak / 1e6:>15.2f} MB "
+                  f"{1 - record_peak / dict_peak:>7.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, default=10)
+    args = parser.parse_args()
+
+    dataset = generate_dataset(args.years)
+    print(f"{args.years}-year dataset\n")
+    print(f"{'collection':<10} {'records':>8} {'dicts (MB)':>11} {'records (MB)':>13} {'saving':>7}")
+
+    total_dicts = total_records = 0
+    for key, raw in dataset.items():
+        count = len(json.loads(raw))
+        dict_bytes = measure(lambda: json.loads(raw))
+        record_bytes = measure(lambda: models.to_records(key, json.loads(raw)))
+
+        # Round-trip must be lossless
+        assert models.to_json(models.to_records(key, json.loads(raw))) == json.loads(raw)
+
+        total_dicts += dict_bytes
+        total_records += record_bytes
+        print(f"{key:<10} {count:>8} {dict_bytes / 1e6:>11.2f} {record_bytes / 1e6:>13.2f} "
+              f"{1 - record_bytes / dict_bytes:>7.0%}")
+
+    print(f"{'total':<10} {'':>8} {total_dicts / 1e6:>11.2f} {total_records / 1e6:>13.2f} "
+          f"{1 - total_records / total_dicts:>7.0%}")
+
+    bench_data_manager(dataset)
+
+
+if __name__ == "__main__":
+    main()
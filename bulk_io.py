@@ -0,0 +1,256 @@
+import csv
+import json
+from collections import Counter
+from datetime import datetime
+
+import ingest
+
+# Column names other trackers use, mapped to ours (matched case-insensitively)
+HEALTH_COLUMNS = {
+    "date": ("date", "day", "logged_on", "timestamp"),
+    "name": ("name", "food", "food_name", "item", "meal", "description"),
+    "calories": ("calories", "kcal", "cals", "energy", "energy (kcal)"),
+    "workout": ("workout", "workout_completed", "exercised"),
+    "weight": ("weight", "weight_log", "weight_kg", "weight (kg)"),
+}
+TASK_COLUMNS = {
+    "name": ("name", "task", "title"),
+    "category": ("category", "list", "project"),
+    "status": ("status", "state"),
+    "created_date": ("created_date", "created", "date"),
+    "completed_date": ("completed_date", "completed", "done_date"),
+}
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d", "%d.%m.%Y")
+TRUE_VALUES = ("1", "true", "yes", "y", "x", "done", "complete", "completed", "finished", "closed", "checked")
+# Food rows with calories but no name: daily-total exports from other trackers
+UNNAMED_FOOD = "Daily total"
+# Other trackers' list names mapped to ours; anything unknown lands in Daily Goal
+CATEGORY_ALIASES = {
+    **{category.lower(): category for category in ingest.TASK_CATEGORIES},
+    "daily": "Daily Goal", "goal": "Daily Goal", "goals": "Daily Goal", "today": "Daily Goal",
+    "job": "Work", "office": "Work",
+    "school": "Study", "learning": "Study", "university": "Study",
+}
+DEFAULT_CATEGORY = "Daily Goal"
+HEALTH_EXPORT_FIELDS = ["date", "name", "calories", "workout", "weight"]
+TASK_EXPORT_FIELDS = ["name", "category", "status", "created_date", "completed_date"]
+
+
+# --- PARSING (lazy) ---
+def iter_rows(f, fmt):
+    """Yields one dict per CSV row or JSONL line, reading `f` as it goes."""
+    if fmt == "csv":
+        yield from csv.DictReader(f)
+    elif fmt == "jsonl":
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {line_no}: {e}")
+    else:
+        raise ValueError(f"Unknown format: {fmt}")
+
+
+def _normalize(row, columns):
+    """Renames a row's keys to ours; unknown columns are dropped."""
+    lowered = {str(k).strip().lower(): v for k, v in row.items() if k is not None}
+    out = {}
+    for field, aliases in columns.items():
+        for alias in aliases:
+            value = lowered.get(alias)
+            if value not in (None, ""):
+                out[field] = value.strip() if isinstance(value, str) else value
+                break
+    return out
+
+
+def _parse_date(value):
+    value = str(value).strip()
+    # ISO timestamps ("2026-01-04T08:30:00") keep just the day
+    if len(value) > 10 and value[4] == "-" and value[10] in "T ":
+        value = value[:10]
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+    raise ValueError(f"Unrecognized date: {value}")
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_VALUES
+
+
+def _parse_category(value):
+    """Our category for `value`, or None if it has no match."""
+    return CATEGORY_ALIASES.get(str(value).strip().lower())
+
+
+# --- IMPORT ---
+def import_health(manager, rows):
+    """
+    Merges food, workout and weight rows into health entries.
+    Rows are grouped by date first, then every collection is written once.
+    Re-importing the same file is a no-op: food entries already present on a
+    day are matched (by name and calories, counting repeats) and skipped.
+    Calories and weights go through the same checks as ingested events.
+    """
+    days = {}
+    for row_no, raw in enumerate(rows, start=1):
+        row = _normalize(raw, HEALTH_COLUMNS)
+        try:
+            date_str = _parse_date(row["date"])
+            day = days.setdefault(date_str, {"foods": [], "workout": False, "weight": None})
+            if "calories" in row:
+                day["foods"].append({"name": row.get("name", UNNAMED_FOOD),
+                                     "calories": ingest.parse_calories(row["calories"])})
+            if "workout" in row:
+                day["workout"] = day["workout"] or _parse_bool(row["workout"])
+            if "weight" in row:
+                day["weight"] = ingest.parse_weight(row["weight"])
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Row {row_no}: {e}")
+
+    stats = {"days": len(days), "foods": 0, "skipped": 0, "weights": 0, "workouts": 0}
+    if not days:
+        return stats
+
+    with manager.batch():
+        health_data = manager.load_data("health")
+        by_date = {entry["date"]: entry for entry in health_data}
+
+        for date_str in sorted(days):
+            incoming = days[date_str]
+            entry = by_date.get(date_str)
+            if entry is None:
+                entry = {"date": date_str, "food_entries": [], "workout_completed": False, "weight_log": None}
+                health_data.append(entry)
+                by_date[date_str] = entry
+
+            existing = Counter((f["name"], f["calories"]) for f in entry["food_entries"])
+            for food in incoming["foods"]:
+                key = (food["name"], food["calories"])
+                if existing[key] > 0:
+                    existing[key] -= 1
+                    stats["skipped"] += 1
+                else:
+                    entry["food_entries"].append(food)
+                    stats["foods"] += 1
+            if incoming["workout"] and not entry.get("workout_completed"):
+                entry["workout_completed"] = True
+                stats["workouts"] += 1
+            if incoming["weight"] is not None:
+                entry["weight_log"] = incoming["weight"]
+                stats["weights"] += 1
+
+        health_data.sort(key=lambda x: x["date"])
+        manager.save_data("health", health_data)
+
+        # Imported weights only move the profile if they are the newest on record
+        weighed = [e for e in health_data if e.get("weight_log")]
+        if weighed and weighed[-1]["date"] in days:
+            profile = manager.load_data("profile")
+            profile["current_weight"] = weighed[-1]["weight_log"]
+            manager.save_data("profile", profile)
+
+        manager.rebuild_streaks()
+        manager.log_action("BULK_IMPORT", f"Imported {stats['foods']} foods over {stats['days']} days")
+    return stats
+
+
+def import_tasks(manager, rows):
+    """
+    Appends tasks in bulk, skipping ones already present (same name and created date).
+    Categories we don't have are filed under Daily Goal and counted as "recategorized",
+    since the task page only lists Daily Goal, Work and Study.
+    """
+    stats = {"tasks": 0, "skipped": 0, "recategorized": 0}
+    with manager.batch():
+        tasks = manager.load_data("tasks")
+        seen = {(t.get("name"), t.get("created_date")) for t in tasks}
+
+        for row_no, raw in enumerate(rows, start=1):
+            row = _normalize(raw, TASK_COLUMNS)
+            try:
+                completed = _parse_date(row["completed_date"]) if "completed_date" in row else None
+                if "created_date" in row:
+                    created = _parse_date(row["created_date"])
+                else:
+                    created = completed or datetime.now().strftime("%Y-%m-%d")
+                if completed is None and _parse_bool(row.get("status", "")):
+                    # Done without a date: the created date is the best guess for streaks
+                    completed = created
+                category = _parse_category(row.get("category", DEFAULT_CATEGORY))
+                task = {
+                    "name": row["name"],
+                    "category": category or DEFAULT_CATEGORY,
+                    "status": "Done" if completed else "Pending",
+                    "created_date": created,
+                    "completed_date": completed
+                }
+            except (KeyError, ValueError) as e:
+                raise ValueError(f"Row {row_no}: {e}")
+
+            if (task["name"], created) in seen:
+                stats["skipped"] += 1
+                continue
+            seen.add((task["name"], created))
+            tasks.append(task)
+            stats["tasks"] += 1
+            if category is None:
+                stats["recategorized"] += 1
+
+        manager.save_data("tasks", tasks)
+        manager.rebuild_streaks()
+        manager.log_action("BULK_IMPORT", f"Imported {stats['tasks']} tasks")
+    return stats
+
+
+# --- EXPORT (streaming) ---
+def iter_health_rows(manager):
+    """One row per food entry; days without food still get a row for workout/weight."""
+    for entry in manager.iter_data("health"):
+        foods = entry.get("food_entries") or [{"name": "", "calories": ""}]
+        for food in foods:
+            yield {
+                "date": entry["date"],
+                "name": food["name"],
+                "calories": food["calories"],
+                "workout": entry.get("workout_completed", False),
+                "weight": entry.get("weight_log") or ""
+            }
+
+
+def iter_task_rows(manager):
+    for task in manager.iter_data("tasks"):
+        yield {field: task.get(field) or "" for field in TASK_EXPORT_FIELDS}
+
+
+def export(manager, kind, fmt, out):
+    """Writes `kind` ("health" or "tasks") to `out` row by row. Returns the row count."""
+    if kind == "health":
+        rows, fields = iter_health_rows(manager), HEALTH_EXPORT_FIELDS
+    elif kind == "tasks":
+        rows, fields = iter_task_rows(manager), TASK_EXPORT_FIELDS
+    else:
+        raise ValueError(f"Cannot export {kind}")
+
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    elif fmt == "jsonl":
+        for row in rows:
+            out.write(json.dumps(row) + "\n")
+            count += 1
+    else:
+        raise ValueError(f"Unknown format: {fmt}")
+    return count
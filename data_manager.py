@@ -1,9 +1,13 @@
 import json
 import os
+import copy
+import bisect
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-import streamlit as st
-import pandas as pd
-from github import Github, GithubException
+from github_client import GitHubClient, GitHubError
+import models
 
 class DataManager:
     DATA_DIR = "data"
@@ -12,9 +16,18 @@ class DataManager:
         "tasks": "tasks.json",
         "health": "health.json",
         "history": "history.json",
-        "journal": "journal.json"
+        "journal": "journal.json",
+        "summary": "summary.json",
+        "streaks": "streaks.json"
     }
 
+    # Collections whose saves feed the materialized "today" summary
+    SUMMARY_SOURCES = ("profile", "tasks", "health", "streaks")
+
+    # Streak metrics and how many missed days each tolerates before a run breaks
+    STREAK_METRICS = ("workout", "calories", "tasks")
+    DEFAULT_STREAK_GAPS = {"workout": 1, "calories": 0, "tasks": 0}
+
     DEFAULT_DATA = {
         "profile": {
             "name": "New User",
@@ -27,25 +40,32 @@ class DataManager:
         "tasks": [],
         "health": [],
         "history": [],
-        "journal": []
+        "journal": [],
+        "summary": {},
+        "streaks": {}
     }
 
     def __init__(self):
         # Check if we are in Cloud Mode (Secrets exist)
         self.cloud_mode = False
-        self.repo = None
+        self.client = None
         self.branch = "main"
+
+        # Batch state (see batch()): loaded collections and keys awaiting a write
+        self._batch_cache = None
+        self._batch_dirty = None
         
         try:
-            if "github" in st.secrets:
+            st = _load_streamlit()
+            if st is not None and "github" in st.secrets:
                 self.cloud_mode = True
                 token = st.secrets["github"]["token"]
                 repo_name = st.secrets["github"]["repo"]
                 self.branch = st.secrets["github"].get("branch", "main")
+                api_url = st.secrets["github"].get("api_url", GitHubClient.API_URL)
                 
                 # Init GitHub
-                g = Github(token)
-                self.repo = g.get_repo(repo_name)
+                self.client = self._session_client(token, repo_name, self.branch, api_url)
         except Exception as e:
             # print(f"GitHub Init Failed: {e}")
             pass # Fallback to local
@@ -66,13 +86,83 @@ class DataManager:
 
     def load_data(self, key):
         """Loads data from either Cloud or Local JSON."""
+        if self._batch_cache is not None:
+            if key not in self._batch_cache:
+                self._batch_cache[key] = self._read(key)
+            return self._batch_cache[key]
+        return self._read(key)
+
+    def iter_data(self, key):
+        """
+        Yields the items of a list collection one at a time. Local files are
+        parsed incrementally, so exports never hold the whole file in memory.
+        Raises ValueError on a malformed file: items already yielded can't be
+        taken back, so callers decide (load_records reads it as empty).
+        """
+        if self.cloud_mode or self._batch_cache is not None:
+            yield from self.load_data(key)
+            return
+        if key not in self.FILES:
+            raise ValueError(f"Invalid data key: {key}")
+        filepath = os.path.join(self.DATA_DIR, self.FILES[key])
+        try:
+            with open(filepath, 'r') as f:
+                yield from _iter_json_array(f)
+        except FileNotFoundError:
+            return
+
+    def save_data(self, key, data):
+        """Saves data to either Cloud or Local JSON."""
+        if self._batch_cache is None:
+            # A lone save is a batch of one, so derived data is updated the same way
+            with self.batch():
+                self.save_data(key, data)
+            return
+        self._batch_cache[key] = data
+        self._batch_dirty.add(key)
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups several helper calls into one write per collection.
+        Inside the block every load/save hits an in-memory copy; on exit the
+        derived summary is updated once, then the touched collections are written
+        once each (nothing is written if an error escapes).
+        """
+        if self._batch_cache is not None:
+            # Already batching, the outer block does the commit
+            yield self
+            return
+
+        self._batch_cache = {}
+        self._batch_dirty = set()
+        try:
+            yield self
+            self._update_derived()
+            for key in self._batch_dirty:
+                self._write(key, self._batch_cache[key])
+        finally:
+            self._batch_cache = None
+            self._batch_dirty = None
+
+    def load_records(self, key):
+        """
+        Loads "health", "tasks" or "history" as compact typed records (see models.py).
+        Items are converted as they are parsed, so the full dict list never exists.
+        A file that doesn't parse reads as empty, the same as load_data.
+        """
+        try:
+            return models.to_records(key, self.iter_data(key))
+        except ValueError:
+            return []
+
+    def _read(self, key):
         if self.cloud_mode:
             return self._load_from_cloud(key)
         else:
             return self._load_from_local(key)
 
-    def save_data(self, key, data):
-        """Saves data to either Cloud or Local JSON."""
+    def _write(self, key, data):
         if self.cloud_mode:
             self._save_to_cloud(key, data)
         else:
@@ -87,92 +177,372 @@ class DataManager:
             with open(filepath, 'r') as f:
                 return json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
-            return self.DEFAULT_DATA[key]
+            return copy.deepcopy(self.DEFAULT_DATA[key])
 
     def _save_to_local(self, key, data):
         filepath = os.path.join(self.DATA_DIR, self.FILES[key])
-        with open(filepath, 'w') as f:
+        # Write a sibling temp file and swap it in: a crash mid-write can't truncate the real file.
+        # The name is per writer, so concurrent sessions never share (and interleave into) one temp file.
+        tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
             json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
 
     # --- CLOUD HANDLING (GitHub) ---
+    def _session_client(self, token, repo_name, branch, api_url):
+        """
+        One GitHubClient per Streamlit session, kept across reruns so its ETag
+        cache and request counters survive (DataManager is rebuilt every rerun).
+        """
+        st = _load_streamlit()
+        if st is None:
+            return GitHubClient(token, repo_name, branch, api_url)
+        try:
+            client = st.session_state.get("github_client")
+            key = (token, repo_name, branch, api_url.rstrip("/"))
+            if client is None or (client.token, client.repo_name, client.branch, client.api_url) != key:
+                client = GitHubClient(token, repo_name, branch, api_url)
+                st.session_state["github_client"] = client
+            return client
+        except Exception:
+            # No Streamlit session (CLI, scripts)
+            return GitHubClient(token, repo_name, branch, api_url)
+
+    def get_cloud_stats(self):
+        """Requests spent by this session and GitHub's remaining rate-limit budget."""
+        if not self.cloud_mode:
+            return None
+        return {**self.client.stats, **{f"rate_{k}": v for k, v in self.client.rate_limit.items()}}
+
     def _load_from_cloud(self, key):
+        """
+        GitHubError propagates once the client's retries are spent: falling back
+        to the defaults here would let a later save in the batch overwrite the
+        real file with them.
+        """
         file_path = f"data/{self.FILES[key]}"
+        json_str, _ = self.client.get_file(file_path)
+        if json_str is None:
+            return copy.deepcopy(self.DEFAULT_DATA[key])
         try:
-            contents = self.repo.get_contents(file_path, ref=self.branch)
-            json_str = contents.decoded_content.decode("utf-8")
             return json.loads(json_str)
-        except GithubException as e:
-            if e.status == 404:
-                return self.DEFAULT_DATA[key]
-            return self.DEFAULT_DATA[key]
-        except Exception:
-            return self.DEFAULT_DATA[key]
+        except json.JSONDecodeError:
+            return copy.deepcopy(self.DEFAULT_DATA[key])
 
     def _save_to_cloud(self, key, data):
         file_path = f"data/{self.FILES[key]}"
         json_str = json.dumps(data, indent=4)
         
+        # The sha from this session's last read/write spares a GET before updating
+        sha = self.client.known_sha(file_path)
+        if sha is None:
+            _, sha = self.client.get_file(file_path)
         try:
-            # Try to get existing file to update (we need the SHA)
-            try:
-                contents = self.repo.get_contents(file_path, ref=self.branch)
-                self.repo.update_file(contents.path, f"Update {key}", json_str, contents.sha, branch=self.branch)
-            except GithubException as e:
-                if e.status == 404:
-                    # Create if doesn't exist
-                    self.repo.create_file(file_path, f"Init {key}", json_str, branch=self.branch)
-        except Exception as e:
-            st.error(f"Failed to save to GitHub: {e}")
+            self.client.put_file(file_path, json_str, f"Update {key}" if sha else f"Init {key}", sha)
+        except GitHubError as e:
+            if e.status not in (409, 422):
+                raise
+            # Someone else wrote since our read. Re-sending our copy would erase their
+            # change, so refuse; the next read fetches theirs and the action can be redone.
+            self.client.forget(file_path)
+            raise GitHubError(e.status, f"{key} was changed in another session, reload and try again")
+
+    # --- TODAY SUMMARY ---
+    def get_today_summary(self):
+        """
+        Small pre-computed document behind the Home dashboard:
+        name, pending task count, today's calories/workout, weights and limit.
+        When the day has rolled over it is computed from the full collections,
+        in memory only: viewing never writes (in Cloud Mode every write is a
+        commit). The next mutating batch saves it.
+        """
+        summary = self.load_data("summary")
+        if summary.get("date") != datetime.now().strftime("%Y-%m-%d"):
+            summary = self._compute_summary()
+        return summary
+
+    def _compute_summary(self):
+        summary = {"date": datetime.now().strftime("%Y-%m-%d")}
+        for key in self.SUMMARY_SOURCES:
+            self._apply_to_summary(summary, key, self.load_data(key))
+        return summary
+
+    def _rebuild_summary(self):
+        summary = self._compute_summary()
+        self.save_data("summary", summary)
+        return summary
+
+    def _update_derived(self):
+        """
+        Runs at batch commit: refreshes the summary fields derived from the
+        collections this batch touched, and saves it only if something changed.
+        A summary left stale by the day rolling over is saved by any batch that
+        writes, since reads no longer do.
+        """
+        if not self._batch_dirty:
+            return
+        if "profile" in self._batch_dirty:
+            index = self.load_data("streaks")
+            cal_limit = self.load_data("profile").get("calorie_limit", 2000)
+            if "metrics" in index and index.get("calorie_limit") != cal_limit:
+                # Every day's calorie streak status may flip with the new limit
+                self.rebuild_streaks()
+
+        summary = self.load_data("summary")
+        if summary.get("date") != datetime.now().strftime("%Y-%m-%d"):
+            # Stale or missing: rebuild from the (already updated) collections,
+            # saving the streak index too if reads have been scanning without one
+            if "metrics" not in self.load_data("streaks"):
+                self.rebuild_streaks()
+            self._rebuild_summary()
+            return
+        sources = [key for key in self.SUMMARY_SOURCES if key in self._batch_dirty]
+        before = copy.deepcopy(summary)
+        for key in sources:
+            self._apply_to_summary(summary, key, self.load_data(key))
+        if summary != before:
+            self.save_data("summary", summary)
+
+    def _apply_to_summary(self, summary, key, data):
+        if key == "profile":
+            summary["name"] = data.get("name", "User")
+            summary["calorie_limit"] = data.get("calorie_limit", 2000)
+            summary["current_weight"] = data.get("current_weight", 0)
+            summary["goal_weight"] = data.get("goal_weight", 0)
+        elif key == "tasks":
+            summary["pending_tasks"] = len([t for t in data if t.get("status") == "Pending"])
+        elif key == "health":
+            summary["calories_consumed"] = 0
+            summary["workout_completed"] = False
+            # Today is almost always the last entry, so scan from the end
+            for entry in reversed(data):
+                if entry["date"] == summary["date"]:
+                    summary["calories_consumed"] = sum(item["calories"] for item in entry.get("food_entries", []))
+                    summary["workout_completed"] = entry.get("workout_completed", False)
+                    break
+        elif key == "streaks" and "metrics" in data:
+            # Only the O(1) numbers, not the day lists
+            summary["streaks"] = {
+                metric: {
+                    "run": m["current"],
+                    "longest": m["longest"],
+                    "last_date": m["days"][-1] if m["days"] else None,
+                    "gap": data["settings"][metric]
+                }
+                for metric, m in data["metrics"].items()
+            }
+
+    # --- STREAKS ---
+    # streaks.json keeps, per metric, the sorted list of qualifying days plus the
+    # length of the run ending at the last day and the longest run. Appending
+    # today (the usual case) updates both in O(1); edits to past days recompute
+    # that one metric from its day list. Readers go through the summary.
+    def get_streaks(self, summary=None):
+        """
+        {metric: {"current", "longest", "gap"}} for workout, calories and tasks.
+        Pass an already loaded today summary to skip the read.
+        """
+        if summary is None:
+            summary = self.get_today_summary()
+        if "streaks" not in summary:
+            # No index yet: scan in memory; the next mutating helper saves one
+            index = self.load_data("streaks")
+            if "metrics" not in index:
+                index = self._compute_streak_index()
+            summary = dict(summary)
+            self._apply_to_summary(summary, "streaks", index)
+
+        today = summary["date"]
+        streaks = {}
+        for metric, s in summary["streaks"].items():
+            alive = s["last_date"] is not None and _missed_days(s["last_date"], today) <= s["gap"]
+            streaks[metric] = {
+                "current": s["run"] if alive else 0,
+                "longest": s["longest"],
+                "gap": s["gap"]
+            }
+        return streaks
+
+    def set_streak_gap(self, metric, gap_days):
+        """Sets how many missed days a `metric` streak tolerates, and recomputes it."""
+        if metric not in self.STREAK_METRICS:
+            raise ValueError(f"Invalid streak metric: {metric}")
+        with self.batch():
+            index = self._load_streak_index()
+            index["settings"][metric] = max(int(gap_days), 0)
+            self._recompute_streak(index, metric)
+            self.save_data("streaks", index)
+
+    def rebuild_streaks(self):
+        """Full scan of health, tasks and history. Only needed once, or after bulk edits."""
+        index = self._compute_streak_index()
+        self.save_data("streaks", index)
+        return index
+
+    def _compute_streak_index(self):
+        index = self.load_data("streaks")
+        settings = dict(self.DEFAULT_STREAK_GAPS)
+        settings.update(index.get("settings", {}))
+        cal_limit = self.load_data("profile").get("calorie_limit", 2000)
+
+        days = {metric: set() for metric in self.STREAK_METRICS}
+        for entry in self.load_records("health"):
+            if entry.workout_completed:
+                days["workout"].add(entry.date)
+            if 0 < entry.total_calories <= cal_limit:
+                days["calories"].add(entry.date)
+        # Completions per day, so unticking one task keeps a day another task earned
+        task_counts = {}
+        for t in self.load_records("tasks"):
+            if t.status == "Done" and t.completed_date:
+                task_counts[t.completed_date] = task_counts.get(t.completed_date, 0) + 1
+        for entry in self.load_records("history"):
+            if entry.action_type == "TASK_COMPLETE":
+                # Archived entries carry the day the task was done; older ones only the archive time
+                day = entry.completed_date or entry.timestamp[:10]
+                task_counts[day] = task_counts.get(day, 0) + 1
+        days["tasks"].update(task_counts)
+
+        index = {"settings": settings, "calorie_limit": cal_limit, "metrics": {}}
+        for metric in self.STREAK_METRICS:
+            index["metrics"][metric] = {"days": sorted(days[metric])}
+            self._recompute_streak(index, metric)
+        index["metrics"]["tasks"]["counts"] = task_counts
+        return index
+
+    def _load_streak_index(self):
+        index = self.load_data("streaks")
+        if "metrics" not in index or "counts" not in index["metrics"]["tasks"]:
+            index = self.rebuild_streaks()
+        return index
+
+    def _mark_streak_day(self, metric, date_str, qualifies):
+        """Adds or removes `date_str` from a metric's qualifying days."""
+        index = self._load_streak_index()
+        m = index["metrics"][metric]
+        days = m["days"]
+        pos = bisect.bisect_left(days, date_str)
+        present = pos < len(days) and days[pos] == date_str
+        if qualifies == present:
+            return
+
+        if qualifies and pos == len(days):
+            # Extending the timeline: continue or restart the last run
+            gap = index["settings"][metric]
+            if days and _missed_days(days[-1], date_str) <= gap:
+                m["current"] += 1
+            else:
+                m["current"] = 1
+            m["longest"] = max(m["longest"], m["current"])
+            days.append(date_str)
+        else:
+            if qualifies:
+                days.insert(pos, date_str)
+            else:
+                days.pop(pos)
+            self._recompute_streak(index, metric)
+        self.save_data("streaks", index)
+
+    def _count_task_day(self, date_str, delta):
+        """Adjusts the completions on `date_str`; the day qualifies while any remain."""
+        index = self._load_streak_index()
+        counts = index["metrics"]["tasks"]["counts"]
+        count = max(counts.get(date_str, 0) + delta, 0)
+        if count:
+            counts[date_str] = count
+        else:
+            counts.pop(date_str, None)
+        self.save_data("streaks", index)
+        self._mark_streak_day("tasks", date_str, count > 0)
+
+    def _recompute_streak(self, index, metric):
+        m = index["metrics"][metric]
+        gap = index["settings"][metric]
+        run = longest = 0
+        prev = None
+        for day in m["days"]:
+            if prev is not None and _missed_days(prev, day) <= gap:
+                run += 1
+            else:
+                run = 1
+            longest = max(longest, run)
+            prev = day
+        m["current"] = run
+        m["longest"] = longest
+
+    def _mark_calorie_day(self, date_str, entry):
+        cal_limit = self.load_data("profile").get("calorie_limit", 2000)
+        if self._load_streak_index().get("calorie_limit") != cal_limit:
+            # Limit changed since the index was built, every day may flip
+            self.rebuild_streaks()
+            return
+        cals = sum(item["calories"] for item in entry.get("food_entries", []))
+        self._mark_streak_day("calories", date_str, 0 < cals <= cal_limit)
 
     # --- EXISTING HELPER METHODS (Unchanged logic, relying on load/save) ---
-    def log_action(self, action_type, details):
+    def log_action(self, action_type, details, **fields):
         entry = {
             "timestamp": datetime.now().isoformat(),
             "action_type": action_type,
-            "details": details
+            "details": details,
+            **fields
         }
         history = self.load_data("history")
         history.append(entry)
         self.save_data("history", history)
 
     def add_task(self, task_name, category):
-        tasks = self.load_data("tasks")
-        new_task = {
-            "name": task_name,
-            "category": category,
-            "status": "Pending",
-            "created_date": datetime.now().strftime("%Y-%m-%d"),
-            "completed_date": None
-        }
-        tasks.append(new_task)
-        self.save_data("tasks", tasks)
-        self.log_action("TASK_ADD", f"Added task: {task_name} ({category})")
+        with self.batch():
+            tasks = self.load_data("tasks")
+            new_task = {
+                "name": task_name,
+                "category": category,
+                "status": "Pending",
+                "created_date": datetime.now().strftime("%Y-%m-%d"),
+                "completed_date": None
+            }
+            tasks.append(new_task)
+            self.save_data("tasks", tasks)
+            self.log_action("TASK_ADD", f"Added task: {task_name} ({category})")
 
     def update_task_status(self, task_index, new_status):
-        tasks = self.load_data("tasks")
-        if 0 <= task_index < len(tasks):
-            task = tasks[task_index]
-            task["status"] = new_status
-            if new_status == "Done":
-                task["completed_date"] = datetime.now().strftime("%Y-%m-%d")
-            self.save_data("tasks", tasks)
+        with self.batch():
+            tasks = self.load_data("tasks")
+            if 0 <= task_index < len(tasks):
+                # Build the index (if needed) before the task changes, or it would count twice
+                self._load_streak_index()
+                task = tasks[task_index]
+                was_done = task.get("status") == "Done"
+                task["status"] = new_status
+                if new_status == "Done" and not was_done:
+                    task["completed_date"] = datetime.now().strftime("%Y-%m-%d")
+                    self._count_task_day(task["completed_date"], 1)
+                elif new_status != "Done" and was_done:
+                    if task.get("completed_date"):
+                        self._count_task_day(task["completed_date"], -1)
+                    task["completed_date"] = None
+                self.save_data("tasks", tasks)
 
     def archive_completed_tasks(self):
-        tasks = self.load_data("tasks")
-        active_tasks = []
-        completed_tasks = []
-        for t in tasks:
-            if t.get("status") == "Done":
-                completed_tasks.append(t)
-            else:
-                active_tasks.append(t)
-        
-        if completed_tasks:
-            self.save_data("tasks", active_tasks)
-            for t in completed_tasks:
-                self.log_action("TASK_COMPLETE", f"Finished: {t['name']}")
-            return len(completed_tasks)
-        return 0
+        with self.batch():
+            tasks = self.load_data("tasks")
+            active_tasks = []
+            completed_tasks = []
+            for t in tasks:
+                if t.get("status") == "Done":
+                    completed_tasks.append(t)
+                else:
+                    active_tasks.append(t)
+            
+            if completed_tasks:
+                self.save_data("tasks", active_tasks)
+                for t in completed_tasks:
+                    self.log_action("TASK_COMPLETE", f"Finished: {t['name']}",
+                                    completed_date=t.get("completed_date"))
+                return len(completed_tasks)
+            return 0
 
     def get_daily_health_entry(self, date_str):
         health_data = self.load_data("health")
@@ -189,6 +559,19 @@ class DataManager:
         self.save_data("health", health_data)
         return new_entry
 
+    def find_health_entry(self, date_str):
+        """Read-only twin of get_daily_health_entry: returns a blank day without saving it."""
+        health_data = self.load_data("health")
+        for entry in reversed(health_data):
+            if entry["date"] == date_str:
+                return entry
+        return {
+            "date": date_str,
+            "food_entries": [],
+            "workout_completed": False,
+            "weight_log": None
+        }
+
     def update_daily_health_entry(self, date_str, updated_entry):
         health_data = self.load_data("health")
         found = False
@@ -202,43 +585,49 @@ class DataManager:
             
         self.save_data("health", health_data)
     
+    # The mutating helpers below each run as one batch: every file they touch,
+    # plus the derived summary, is written once. find_health_entry (not
+    # get_daily_health_entry) avoids saving a blank day before the real update.
     def add_food_log(self, date_str, food_name, calories):
-        entry = self.get_daily_health_entry(date_str)
-        entry["food_entries"].append({"name": food_name, "calories": calories})
-        self.update_daily_health_entry(date_str, entry)
-        self.log_action("FOOD_LOG", f"Ate {food_name} ({calories} kcal)")
+        with self.batch():
+            entry = self.find_health_entry(date_str)
+            entry["food_entries"].append({"name": food_name, "calories": calories})
+            self.update_daily_health_entry(date_str, entry)
+            self._mark_calorie_day(date_str, entry)
+            self.log_action("FOOD_LOG", f"Ate {food_name} ({calories} kcal)")
 
     def set_workout_status(self, date_str, status):
-        entry = self.get_daily_health_entry(date_str)
-        entry["workout_completed"] = status
-        self.update_daily_health_entry(date_str, entry)
-        action = "Completed workout" if status else "Undo workout"
-        self.log_action("WORKOUT_LOG", action)
+        with self.batch():
+            entry = self.find_health_entry(date_str)
+            entry["workout_completed"] = status
+            self.update_daily_health_entry(date_str, entry)
+            self._mark_streak_day("workout", date_str, bool(status))
+            action = "Completed workout" if status else "Undo workout"
+            self.log_action("WORKOUT_LOG", action)
 
     def log_weight(self, date_str, weight):
-        entry = self.get_daily_health_entry(date_str)
-        entry["weight_log"] = weight
-        self.update_daily_health_entry(date_str, entry)
-        profile = self.load_data("profile")
-        profile["current_weight"] = weight
-        self.save_data("profile", profile)
-        self.log_action("WEIGHT_LOG", f"Logged weight: {weight}kg")
+        with self.batch():
+            entry = self.find_health_entry(date_str)
+            entry["weight_log"] = weight
+            self.update_daily_health_entry(date_str, entry)
+            profile = self.load_data("profile")
+            profile["current_weight"] = weight
+            self.save_data("profile", profile)
+            self.log_action("WEIGHT_LOG", f"Logged weight: {weight}kg")
 
     def get_weight_history(self):
-        health_data = self.load_data("health")
-        # Ensure health_data is a list (sometimes pandas connection might return empty df as empty list)
-        if not isinstance(health_data, list): health_data = []
+        health_data = self.load_records("health")
         
-        sorted_data = sorted(health_data, key=lambda x: x["date"])
+        sorted_data = sorted(health_data, key=lambda x: x.date)
         history = {}
         for entry in sorted_data:
-            if entry.get("weight_log"):
-                history[entry["date"]] = entry["weight_log"]
+            if entry.weight_log:
+                history[entry.date] = entry.weight_log
         return history
 
     def get_monthly_analytics(self, year, month):
         month_str = f"{year}-{month:02d}"
-        health_data = self.load_data("health")
+        health_data = self.load_records("health")
         profile = self.load_data("profile")
         cal_limit = profile.get("calorie_limit", 2000)
         
@@ -249,40 +638,40 @@ class DataManager:
         weights = []
         
         for entry in health_data:
-            if entry["date"].startswith(month_str):
+            if entry.date.startswith(month_str):
                 days_tracked += 1
-                cals = sum(item["calories"] for item in entry.get("food_entries", []))
-                daily_cals[entry["date"]] = cals
+                cals = entry.total_calories
+                daily_cals[entry.date] = cals
                 if cals > 0 and cals <= cal_limit:
                     days_under_limit += 1
-                if entry.get("workout_completed"):
+                if entry.workout_completed:
                     workouts_count += 1
-                w = entry.get("weight_log")
+                w = entry.weight_log
                 if w:
-                    weights.append((entry["date"], w))
+                    weights.append((entry.date, w))
         
         weights.sort()
         weight_change = 0.0
         if len(weights) > 1:
             weight_change = weights[-1][1] - weights[0][1]
 
-        tasks = self.load_data("tasks")
+        tasks = self.load_records("tasks")
         tasks_completed_month = 0
         
         # Check active tasks
         for t in tasks:
-            if t.get("status") == "Done":
-                if t.get("completed_date", "").startswith(month_str):
+            if t.status == "Done":
+                if (t.completed_date or "").startswith(month_str):
                     tasks_completed_month += 1
         
         # Check history
-        history = self.load_data("history")
+        history = self.load_records("history")
         for entry in history:
-            if entry["timestamp"].startswith(month_str):
-                if entry["action_type"] == "TASK_COMPLETE":
+            if entry.action_type == "TASK_COMPLETE":
+                if (entry.completed_date or entry.timestamp).startswith(month_str):
                     tasks_completed_month += 1
         
-        active_pending = len([t for t in tasks if t.get("status") == "Pending"])
+        active_pending = len([t for t in tasks if t.status == "Pending"])
         total_relevant = tasks_completed_month + active_pending
         completion_rate = 0.0
         if total_relevant > 0:
@@ -298,17 +687,83 @@ class DataManager:
         }
 
     def add_journal_entry(self, title, content):
-        journal = self.load_data("journal")
-        entry = {
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "title": title,
-            "content": content
-        }
-        journal.append(entry)
-        self.save_data("journal", journal)
-        self.log_action("JOURNAL_ADD", f"Created entry: {title}")
+        with self.batch():
+            journal = self.load_data("journal")
+            entry = {
+                "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "title": title,
+                "content": content
+            }
+            journal.append(entry)
+            self.save_data("journal", journal)
+            self.log_action("JOURNAL_ADD", f"Created entry: {title}")
 
     def get_journal_entries(self):
         journal = self.load_data("journal")
         if not isinstance(journal, list): journal = []
         return sorted(journal, key=lambda x: x["date"], reverse=True)
+
+
+def _missed_days(earlier, later):
+    """Whole days strictly between two YYYY-MM-DD dates."""
+    delta = datetime.strptime(later, "%Y-%m-%d") - datetime.strptime(earlier, "%Y-%m-%d")
+    return delta.days - 1
+
+
+def _load_streamlit():
+    """
+    The streamlit module, or None when this process has no use for it. The app
+    has already imported it; a script (the CLI) only needs it to read a
+    secrets.toml, and importing it would cost most of a CLI call.
+    """
+    if "streamlit" in sys.modules:
+        return sys.modules["streamlit"]
+    secrets_files = (os.path.join(os.path.expanduser("~"), ".streamlit", "secrets.toml"),
+                     os.path.join(os.getcwd(), ".streamlit", "secrets.toml"))
+    if not any(os.path.exists(path) for path in secrets_files):
+        return None
+    import streamlit
+    return streamlit
+
+
+def _iter_json_array(f, chunk_size=65536):
+    """Decodes a top-level JSON array item by item from a file object."""
+    decoder = json.JSONDecoder()
+    buf = f.read(chunk_size)
+    eof = not buf
+    pos = 0
+
+    def skip(chars):
+        nonlocal pos
+        while pos < len(buf) and buf[pos] in chars:
+            pos += 1
+
+    skip(" \t\r\n")
+    if pos >= len(buf):
+        return
+    if buf[pos] != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    while True:
+        skip(" \t\r\n,")
+        if pos < len(buf) and buf[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+            # A value that ends exactly at the buffer edge may be cut short (e.g. a number)
+            complete = end < len(buf) or eof
+        except json.JSONDecodeError:
+            complete = False
+        if complete:
+            yield item
+            pos = end
+            continue
+
+        chunk = f.read(chunk_size)
+        if not chunk:
+            if eof:
+                raise ValueError("Truncated JSON array")
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
@@ -0,0 +1,125 @@
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, unquote
+
+
+class FakeGitHub:
+    """
+    Local HTTP server speaking the slice of the GitHub contents API that
+    GitHubClient uses: ETag/If-None-Match, SHA checks on PUT, X-RateLimit-*
+    headers, and injected errors (random 502s at `fail_rate`, or exact
+    responses queued with fail_next()) to exercise retries.
+    """
+
+    def __init__(self, fail_rate=0.0, rate_limit=5000):
+        self.files = {}
+        self.lock = threading.Lock()
+        self.conflicts = 0
+        self.requests = 0
+        self.fail_rate = fail_rate
+        self.remaining = rate_limit
+        self.rate_limit = rate_limit
+        # (status, message, headers) answered, in order, before any real handling
+        self.failures = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def set_file(self, path, content):
+        """Writes `path` as if another client had pushed it. Returns the new sha."""
+        with self.lock:
+            sha = self._new_sha(path)
+            self.files[path] = (content, sha)
+            return sha
+
+    def fail_next(self, status, message="Server Error", headers=None, times=1):
+        """Answers the next `times` requests with `status` (and extra `headers`)."""
+        with self.lock:
+            self.failures.extend([(status, message, headers or {})] * times)
+
+    def _new_sha(self, path):
+        return hashlib.sha1(f"{path}{time.time_ns()}{random.random()}".encode()).hexdigest()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_PUT(self):
+                self._handle("PUT")
+
+            def _handle(self, method):
+                with fake.lock:
+                    fake.requests += 1
+                    if fake.failures:
+                        status, message, headers = fake.failures.pop(0)
+                        self._reply(status, {"message": message}, headers=headers)
+                        return
+                    if random.random() < fake.fail_rate:
+                        self._reply(502, {"message": "Server Error"})
+                        return
+                    path = unquote(urlparse(self.path).path).split("/contents/", 1)[-1]
+                    if method == "GET":
+                        self._get(path)
+                    else:
+                        length = int(self.headers.get("Content-Length") or 0)
+                        self._put(path, json.loads(self.rfile.read(length)))
+
+            def _get(self, path):
+                if path not in fake.files:
+                    self._reply(404, {"message": "Not Found"}, spend=True)
+                    return
+                content, sha = fake.files[path]
+                if self.headers.get("If-None-Match") == f'"{sha}"':
+                    # Conditional hits don't count against GitHub's rate limit
+                    self._reply(304, None)
+                    return
+                self._reply(200, {
+                    "sha": sha,
+                    "encoding": "base64",
+                    "content": base64.b64encode(content.encode("utf-8")).decode("ascii")
+                }, headers={"ETag": f'"{sha}"'}, spend=True)
+
+            def _put(self, path, body):
+                current = fake.files.get(path)
+                if current is None and body.get("sha") or current is not None and body.get("sha") != current[1]:
+                    fake.conflicts += 1
+                    status = 409 if body.get("sha") else 422
+                    self._reply(status, {"message": f"{path} does not match"}, spend=True)
+                    return
+                sha = fake._new_sha(path)
+                fake.files[path] = (base64.b64decode(body["content"]).decode("utf-8"), sha)
+                self._reply(201 if current is None else 200, {"content": {"sha": sha}}, spend=True)
+
+            def _reply(self, status, payload, headers=None, spend=False):
+                if spend:
+                    fake.remaining = max(fake.remaining - 1, 0)
+                data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+                self.send_response(status)
+                self.send_header("X-RateLimit-Limit", str(fake.rate_limit))
+                self.send_header("X-RateLimit-Remaining", str(fake.remaining))
+                self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
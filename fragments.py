@@ -0,0 +1,15 @@
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+
+def rerun_fragment():
+    """
+    Reruns the calling fragment after it saved something. The same code can run
+    inside a full-app run too (first render, a navigation, widget state left over
+    from before another tab's write), where Streamlit refuses a fragment-scoped
+    rerun; the whole app reruns then.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
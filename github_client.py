@@ -0,0 +1,198 @@
+import base64
+import json
+import random
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import quote
+
+
+class GitHubError(Exception):
+    def __init__(self, status, message):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class RateLimitExceeded(GitHubError):
+    """Raised instead of spending the last requests of the hourly budget."""
+
+
+class GitHubClient:
+    """
+    Minimal GitHub contents API client used by DataManager in Cloud Mode.
+
+    - Conditional reads: every file's ETag is remembered and sent back as
+      If-None-Match, so an unchanged file answers 304 (free, no body).
+    - Rate-limit budget: X-RateLimit-* headers are tracked and requests stop
+      (RateLimitExceeded) once only `reserve` calls remain before the reset.
+    - Retries: 5xx, 429 and secondary rate limits are retried with jittered
+      exponential backoff, honouring Retry-After when GitHub sends it.
+    - `stats` counts what this client (one per Streamlit session) has spent.
+    """
+    API_URL = "https://api.github.com"
+    RETRY_STATUSES = (500, 502, 503, 504, 429)
+
+    def __init__(self, token, repo_name, branch="main", api_url=API_URL,
+                 max_retries=4, backoff=0.5, max_backoff=30.0, reserve=10, timeout=15):
+        self.token = token
+        self.repo_name = repo_name
+        self.branch = branch
+        self.api_url = api_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.reserve = reserve
+        self.timeout = timeout
+
+        self.rate_limit = {"limit": None, "remaining": None, "reset": None}
+        self.stats = {"requests": 0, "not_modified": 0, "retries": 0, "failures": 0}
+        # path -> {"etag", "sha", "content"}
+        self._cache = {}
+
+    # --- FILES ---
+    def get_file(self, path):
+        """Returns (text, sha) for `path` on the branch, or (None, None) if it doesn't exist."""
+        cached = self._cache.get(path)
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        status, body, resp_headers = self._request(
+            "GET", f"{self._contents_url(path)}?ref={quote(self.branch)}", headers=headers)
+
+        if status == 304:
+            self.stats["not_modified"] += 1
+            return cached["content"], cached["sha"]
+        if status == 404:
+            self._cache.pop(path, None)
+            return None, None
+
+        if body.get("encoding") == "base64":
+            content = base64.b64decode(body["content"]).decode("utf-8")
+        else:
+            # Files over 1 MB come back without inline content; fetch the blob
+            content = self._get_blob(body["sha"])
+
+        self._cache[path] = {"etag": resp_headers.get("ETag"), "sha": body["sha"], "content": content}
+        return content, body["sha"]
+
+    def put_file(self, path, content, message, sha=None):
+        """Creates or updates `path`. `sha` must be the current blob sha when updating."""
+        payload = {
+            "message": message,
+            "content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
+            "branch": self.branch
+        }
+        if sha:
+            payload["sha"] = sha
+
+        _, body, _ = self._request("PUT", self._contents_url(path), payload=payload)
+        new_sha = body["content"]["sha"]
+        # No ETag for the new version yet: the next read fetches it once
+        self._cache[path] = {"etag": None, "sha": new_sha, "content": content}
+        return new_sha
+
+    def known_sha(self, path):
+        """Last sha seen for `path` in this session, if any (saves a read before writing)."""
+        cached = self._cache.get(path)
+        return cached["sha"] if cached else None
+
+    def forget(self, path):
+        """Drops what this session knows about `path`, so the next read fetches it in full."""
+        self._cache.pop(path, None)
+
+    def _get_blob(self, sha):
+        _, body, _ = self._request("GET", f"{self.api_url}/repos/{self.repo_name}/git/blobs/{sha}")
+        return base64.b64decode(body["content"]).decode("utf-8")
+
+    def _contents_url(self, path):
+        return f"{self.api_url}/repos/{self.repo_name}/contents/{quote(path)}"
+
+    # --- TRANSPORT ---
+    def _request(self, method, url, payload=None, headers=None):
+        """Returns (status, json_body, headers) for 2xx, 304 and 404; raises GitHubError otherwise."""
+        self._check_budget()
+
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        all_headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "LifeTracker"
+        }
+        if data is not None:
+            all_headers["Content-Type"] = "application/json"
+        all_headers.update(headers or {})
+
+        attempt = 0
+        while True:
+            self.stats["requests"] += 1
+            req = urllib.request.Request(url, data=data, method=method, headers=all_headers)
+            retry_after = None
+            try:
+                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                    self._track_rate_limit(resp.headers)
+                    raw = resp.read()
+                    return resp.status, json.loads(raw) if raw else {}, resp.headers
+            except urllib.error.HTTPError as e:
+                self._track_rate_limit(e.headers)
+                raw = e.read()
+                if e.code in (304, 404):
+                    return e.code, {}, e.headers
+
+                message = _error_message(raw) or e.reason
+                if not self._should_retry(e.code, e.headers, message):
+                    self.stats["failures"] += 1
+                    if e.code == 403 and self.rate_limit["remaining"] == 0:
+                        raise RateLimitExceeded(e.code, message)
+                    raise GitHubError(e.code, message)
+                error = GitHubError(e.code, message)
+                retry_after = e.headers.get("Retry-After")
+            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+                error = GitHubError(0, str(getattr(e, "reason", e)))
+
+            if attempt >= self.max_retries:
+                self.stats["failures"] += 1
+                raise error
+            attempt += 1
+            self.stats["retries"] += 1
+            time.sleep(self._retry_delay(attempt, retry_after))
+
+    def _should_retry(self, status, headers, message):
+        if status in self.RETRY_STATUSES:
+            return True
+        # Secondary (abuse) limits are 403s that say so, or carry Retry-After
+        return status == 403 and ("secondary rate limit" in message.lower() or "Retry-After" in headers)
+
+    def _retry_delay(self, attempt, retry_after=None):
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        # Full jitter: spread concurrent sessions so they don't retry in lockstep
+        return random.uniform(0, min(self.backoff * (2 ** attempt), self.max_backoff))
+
+    def _track_rate_limit(self, headers):
+        if headers is None or headers.get("X-RateLimit-Remaining") is None:
+            return
+        self.rate_limit = {
+            "limit": int(headers.get("X-RateLimit-Limit", 0)),
+            "remaining": int(headers["X-RateLimit-Remaining"]),
+            "reset": int(headers.get("X-RateLimit-Reset", 0))
+        }
+
+    def _check_budget(self):
+        remaining = self.rate_limit["remaining"]
+        reset = self.rate_limit["reset"] or 0
+        if remaining is not None and remaining <= self.reserve and time.time() < reset:
+            wait = int(reset - time.time())
+            raise RateLimitExceeded(403, f"GitHub budget exhausted ({remaining} left), resets in {wait}s")
+
+
+def _error_message(raw):
+    try:
+        return json.loads(raw).get("message", "")
+    except (ValueError, AttributeError):
+        return ""
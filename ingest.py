@@ -0,0 +1,162 @@
+import json
+import math
+from datetime import datetime
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+TASK_CATEGORIES = ["Daily Goal", "Work", "Study"]
+
+
+def _today():
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _require(event, field):
+    value = event.get(field)
+    if value is None or value == "":
+        raise ValueError(f"'{event.get('type')}' event is missing '{field}'")
+    return value
+
+
+def _date(event):
+    """The event's YYYY-MM-DD date (today if absent); anything else would break date math later."""
+    value = event.get("date")
+    if value is None or value == "":
+        return _today()
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+def parse_number(field, value, cast):
+    """`value` as a finite number of type `cast`; NaN and infinity would not survive a JSON save."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{field}' must be a number, got {value!r}")
+    if not math.isfinite(number):
+        raise ValueError(f"'{field}' must be finite, got {value!r}")
+    return cast(number)
+
+
+def parse_calories(value):
+    calories = parse_number("calories", value, int)
+    if calories < 0:
+        raise ValueError("Calories must be positive")
+    return calories
+
+
+def parse_weight(value):
+    weight = parse_number("weight", value, float)
+    if weight <= 0:
+        raise ValueError("Weight must be positive")
+    return weight
+
+
+# --- EVENT DISPATCH ---
+def apply_event(manager, event):
+    """
+    Routes one event dict to the matching DataManager helper, after validating it.
+    Use apply_events() for writes: a failure there leaves nothing half-saved.
+    """
+    if not isinstance(event, dict):
+        raise ValueError("Event must be a JSON object")
+
+    kind = event.get("type")
+    if kind == "food":
+        calories = parse_calories(_require(event, "calories"))
+        name = _require(event, "name")
+        manager.add_food_log(_date(event), name, calories)
+    elif kind == "weight":
+        weight = parse_weight(_require(event, "weight"))
+        manager.log_weight(_date(event), weight)
+    elif kind == "task":
+        category = event.get("category", "Daily Goal")
+        if category not in TASK_CATEGORIES:
+            raise ValueError(f"Unknown task category: {category}")
+        manager.add_task(_require(event, "name"), category)
+    elif kind == "journal":
+        manager.add_journal_entry(_require(event, "title"), _require(event, "content"))
+    else:
+        raise ValueError(f"Unknown event type: {kind}")
+
+
+def apply_events(manager, events):
+    """
+    Applies many events as one batch: each touched collection is written once.
+    Nothing is written if any event is invalid.
+    """
+    count = 0
+    with manager.batch():
+        for event in events:
+            apply_event(manager, event)
+            count += 1
+    return count
+
+
+def parse_jsonl(lines):
+    """Yields one event per non-blank JSON line."""
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line_no}: {e}")
+
+
+# --- HTTP ENDPOINT ---
+class IngestHandler(BaseHTTPRequestHandler):
+    """
+    POST /log    -> one JSON event, or a JSON array of events
+    POST /batch  -> JSONL body, one event per line
+    Every request is committed as a single batch.
+    """
+    manager = None
+    token = None
+
+    def do_POST(self):
+        if self.token and self.headers.get("Authorization") != f"Bearer {self.token}":
+            self._reply(401, {"ok": False, "error": "Unauthorized"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length).decode("utf-8")
+            if self.path == "/log":
+                payload = json.loads(body)
+                events = payload if isinstance(payload, list) else [payload]
+            elif self.path == "/batch":
+                events = list(parse_jsonl(body.splitlines()))
+            else:
+                self._reply(404, {"ok": False, "error": f"Unknown path: {self.path}"})
+                return
+            count = apply_events(self.manager, events)
+        except (ValueError, TypeError) as e:
+            # UnicodeDecodeError and JSONDecodeError are ValueErrors too
+            self._reply(400, {"ok": False, "error": str(e)})
+            return
+
+        self._reply(200, {"ok": True, "count": count})
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def serve(manager, host="127.0.0.1", port=8502, token=None):
+    """Runs the ingestion endpoint. Single-threaded on purpose: writes never interleave."""
+    handler = type("BoundIngestHandler", (IngestHandler,), {"manager": manager, "token": token})
+    server = HTTPServer((host, port), handler)
+    print(f"LifeTracker ingest listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
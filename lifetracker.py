@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+LifeTracker command line: log without loading the Streamlit UI.
+
+    python lifetracker.py food "Idly" 300
+    python lifetracker.py weight 82.4 --date 2026-01-04
+    python lifetracker.py task "One Leetcode" --category "Daily Goal"
+    python lifetracker.py journal "Good day" "Finished the sprint."
+    cat events.jsonl | python lifetracker.py batch
+    python lifetracker.py import health myfitnesspal.csv
+    python lifetracker.py export health --format jsonl -o health.jsonl
+    python lifetracker.py snapshot create
+    python lifetracker.py snapshot restore 20260104T015413909622
+    python lifetracker.py serve --port 8502
+"""
+import argparse
+import json
+import os
+import sys
+
+from data_manager import DataManager
+import ingest
+import bulk_io
+import snapshots
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="lifetracker", description="Fast logging for LifeTracker.")
+    parser.add_argument("--data-dir", default=os.path.join(PROJECT_DIR, DataManager.DATA_DIR),
+                        help="Directory holding the JSON data files (local mode)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("food", help="Log a meal")
+    p.add_argument("name")
+    p.add_argument("calories", type=int)
+    p.add_argument("--date", help="YYYY-MM-DD, defaults to today")
+
+    p = sub.add_parser("weight", help="Log today's weight")
+    p.add_argument("weight", type=float)
+    p.add_argument("--date", help="YYYY-MM-DD, defaults to today")
+
+    p = sub.add_parser("task", help="Add a task")
+    p.add_argument("name")
+    p.add_argument("--category", default="Daily Goal", choices=ingest.TASK_CATEGORIES)
+
+    p = sub.add_parser("journal", help="Write a journal entry")
+    p.add_argument("title")
+    p.add_argument("content")
+
+    p = sub.add_parser("batch", help="Apply JSONL events in one write")
+    p.add_argument("file", nargs="?", help="JSONL file, defaults to stdin")
+
+    p = sub.add_parser("import", help="Bulk import health or task rows from CSV/JSONL")
+    p.add_argument("kind", choices=["health", "tasks"])
+    p.add_argument("file", help="CSV or JSONL file, '-' for stdin")
+    p.add_argument("--format", choices=["csv", "jsonl"], help="Defaults to the file extension")
+
+    p = sub.add_parser("export", help="Stream health or task rows as CSV/JSONL")
+    p.add_argument("kind", choices=["health", "tasks"])
+    p.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    p.add_argument("-o", "--output", help="Output file, defaults to stdout")
+
+    p = sub.add_parser("snapshot", help="Create, list, restore or prune data snapshots")
+    snap = p.add_subparsers(dest="action", required=True)
+    sp = snap.add_parser("create")
+    sp.add_argument("--force", action="store_true", help="Snapshot even if nothing changed")
+    snap.add_parser("list")
+    sp = snap.add_parser("restore")
+    sp.add_argument("snapshot_id")
+    sp.add_argument("--only", nargs="+", choices=list(DataManager.FILES), help="Restore just these files")
+    sp = snap.add_parser("prune")
+    sp.add_argument("--keep", type=int, required=True)
+
+    p = sub.add_parser("serve", help="Run the HTTP ingestion endpoint")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8502)
+    p.add_argument("--token", default=os.environ.get("LIFETRACKER_TOKEN"),
+                   help="Require 'Authorization: Bearer <token>' on every request")
+
+    return parser
+
+
+def run(args, manager):
+    if args.command == "food":
+        ingest.apply_events(manager, [{"type": "food", "name": args.name, "calories": args.calories, "date": args.date}])
+    elif args.command == "weight":
+        ingest.apply_events(manager, [{"type": "weight", "weight": args.weight, "date": args.date}])
+    elif args.command == "task":
+        ingest.apply_events(manager, [{"type": "task", "name": args.name, "category": args.category}])
+    elif args.command == "journal":
+        ingest.apply_events(manager, [{"type": "journal", "title": args.title, "content": args.content}])
+    elif args.command == "batch":
+        if args.file:
+            with open(args.file, "r") as f:
+                count = ingest.apply_events(manager, ingest.parse_jsonl(f))
+        else:
+            count = ingest.apply_events(manager, ingest.parse_jsonl(sys.stdin))
+        print(json.dumps({"ok": True, "count": count}))
+    elif args.command == "import":
+        fmt = args.format or ("jsonl" if args.file.endswith((".jsonl", ".ndjson")) else "csv")
+        importer = bulk_io.import_health if args.kind == "health" else bulk_io.import_tasks
+        if args.file == "-":
+            stats = importer(manager, bulk_io.iter_rows(sys.stdin, fmt))
+        else:
+            with open(args.file, "r", newline="", encoding="utf-8-sig") as f:
+                stats = importer(manager, bulk_io.iter_rows(f, fmt))
+        print(json.dumps({"ok": True, **stats}))
+    elif args.command == "export":
+        if args.output:
+            with open(args.output, "w", newline="", encoding="utf-8") as f:
+                count = bulk_io.export(manager, args.kind, args.format, f)
+            print(json.dumps({"ok": True, "rows": count}), file=sys.stderr)
+        else:
+            bulk_io.export(manager, args.kind, args.format, sys.stdout)
+    elif args.command == "snapshot":
+        if args.action == "create":
+            result = snapshots.create_snapshot(manager, force=args.force)
+            print(json.dumps(result or {"ok": True, "unchanged": True}))
+        elif args.action == "list":
+            for snap in snapshots.list_snapshots(manager):
+                print(f"{snap['id']}  {snap['created'][:19]}  {snap['files_changed']} changed  "
+                      f"{snap['new_bytes']} new bytes  {snap['total_bytes']} total")
+        elif args.action == "restore":
+            restored = snapshots.restore_snapshot(manager, args.snapshot_id, args.only)
+            print(json.dumps({"ok": True, "restored": restored}))
+        elif args.action == "prune":
+            print(json.dumps(snapshots.prune_snapshots(manager, args.keep)))
+    elif args.command == "serve":
+        ingest.serve(manager, args.host, args.port, args.token)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    DataManager.DATA_DIR = args.data_dir
+    manager = DataManager()
+
+    try:
+        run(args, manager)
+    except (ValueError, OSError) as e:
+        print(f"lifetracker: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Concurrent-session load test: drives app.py through Streamlit's AppTest from
+many simulated sessions sharing one data directory.
+
+    python loadtest.py --sessions 8 --iterations 5
+    python loadtest.py --sessions 8 --mode threads
+    python loadtest.py --sessions 8 --backend github --fail-rate 0.05
+
+Reports p50/p95 rerun latency (each session's warm-up pass over the journeys is
+reported apart as cold start), throughput, app exceptions, lost updates (entries a session saved
+that are missing at the end) and corrupted files.
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from streamlit.testing.v1 import AppTest
+
+from data_manager import DataManager
+from fake_github import FakeGitHub
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+PAGES = {
+    "home": "🏠 Home",
+    "tasks": "📝 Tasks",
+    "health": "🍎 Health & Calorie",
+    "analytics": "📊 Annual Wrapped",
+}
+
+# AppTest.run() swaps process-wide state on the way in and out (Runtime._instance,
+# st.secrets, config options), so sessions sharing a process must take turns.
+# Set in threads mode only; worker processes each have their own.
+_RUN_LOCK = None
+# Holds every session after its warm-up, so no measured rerun competes for the
+# CPU with another session's cold start
+_START_BARRIER = None
+
+
+# --- JOURNEYS ---
+def _timed(stats, action, series="latencies"):
+    with _RUN_LOCK or contextlib.nullcontext():
+        start = time.perf_counter()
+        at = action()
+        stats[series].append(time.perf_counter() - start)
+    if at.exception:
+        stats["exceptions"].extend(str(e.message) for e in at.exception)
+    return at
+
+
+def _goto(at, stats, page):
+    return _timed(stats, lambda: at.sidebar.radio[0].set_value(PAGES[page]).run())
+
+
+def _by_label(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+def journey_log_food(at, stats, tag):
+    _goto(at, stats, "health")
+    name = f"food-{tag}"
+    _by_label(at.text_input, "Food Name").input(name)
+    _by_label(at.number_input, "Calories").set_value(random.randrange(100, 800, 10))
+    _timed(stats, lambda: _by_label(at.button, "Add Entry").click().run())
+    stats["expected_foods"].append(name)
+
+
+def journey_toggle_task(at, stats, tag):
+    _goto(at, stats, "tasks")
+    name = f"task-{tag}"
+    _by_label(at.text_input, "Task Name").input(name)
+    _timed(stats, lambda: _by_label(at.button, "Add Task").click().run())
+    stats["expected_tasks"].append(name)
+    box = next((c for c in at.checkbox if c.label == name), None)
+    if box is not None:
+        _timed(stats, lambda: box.check().run())
+
+
+def journey_open_analytics(at, stats, tag):
+    _goto(at, stats, "analytics")
+    _goto(at, stats, "home")
+
+
+JOURNEYS = [journey_log_food, journey_toggle_task, journey_open_analytics]
+
+
+def run_session(session_id, iterations, github_url=None):
+    """One simulated browser tab running random journeys."""
+    stats = {"latencies": [], "cold_starts": [], "exceptions": [], "expected_foods": [], "expected_tasks": []}
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    if github_url:
+        at.secrets["github"] = {"token": "fake", "repo": "loadtest/data", "branch": "main", "api_url": github_url}
+    # Warm-up: the first run, and the first chart drawn once there is data, pay
+    # for imports in a fresh worker. One pass of every journey is reported on its
+    # own (its saves still count) so the percentiles show steady state.
+    _timed(stats, at.run, "cold_starts")
+    for journey in JOURNEYS:
+        journey(at, stats, f"s{session_id}-warmup")
+    stats["cold_starts"] += stats.pop("latencies")
+    stats["latencies"] = []
+    _START_BARRIER.wait(timeout=600)
+
+    stats["started"] = time.monotonic()
+    for i in range(iterations):
+        journey = random.choice(JOURNEYS)
+        try:
+            journey(at, stats, f"s{session_id}-{i}")
+        except Exception as e:
+            stats["exceptions"].append(f"{journey.__name__}: {e!r}")
+    stats["finished"] = time.monotonic()
+    return stats
+
+
+# --- ENVIRONMENT ---
+def _setup(data_dir, barrier):
+    """Points DataManager at the shared test data (called once per worker process)."""
+    global _START_BARRIER
+    DataManager.DATA_DIR = data_dir
+    _START_BARRIER = barrier
+
+
+def _read_collection(key, fake_github=None):
+    """Final contents of one collection, raising ValueError if it doesn't parse."""
+    if fake_github:
+        path = f"data/{DataManager.FILES[key]}"
+        if path not in fake_github.files:
+            return DataManager.DEFAULT_DATA[key]
+        raw = fake_github.files[path][0]
+    else:
+        with open(os.path.join(DataManager.DATA_DIR, DataManager.FILES[key]), "r") as f:
+            raw = f.read()
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{key}: {e}")
+
+
+def _watch_files(data_dir, stop, incidents):
+    """Re-parses every local file while the load runs to catch torn writes."""
+    while not stop.is_set():
+        for filename in DataManager.FILES.values():
+            path = os.path.join(data_dir, filename)
+            try:
+                with open(path, "r") as f:
+                    json.loads(f.read())
+            except FileNotFoundError:
+                pass
+            except json.JSONDecodeError:
+                incidents.append(filename)
+        stop.wait(0.05)
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+def run_load(sessions, iterations, mode, backend, data_dir, fail_rate=0.0):
+    global _RUN_LOCK
+    _RUN_LOCK = threading.Lock() if mode == "threads" else None
+    barrier = threading.Barrier(sessions) if mode == "threads" else multiprocessing.Barrier(sessions)
+    _setup(data_dir, barrier)
+    DataManager()  # create the files up front so sessions start from the same state
+
+    fake_github = FakeGitHub(fail_rate).start() if backend == "github" else None
+    github_url = fake_github.url if fake_github else None
+
+    stop = threading.Event()
+    torn_reads = []
+    watcher = None
+    if backend == "local":
+        watcher = threading.Thread(target=_watch_files, args=(data_dir, stop, torn_reads), daemon=True)
+        watcher.start()
+
+    if mode == "threads":
+        pool = ThreadPoolExecutor(max_workers=sessions)
+    else:
+        pool = ProcessPoolExecutor(max_workers=sessions, initializer=_setup, initargs=(data_dir, barrier))
+
+    with pool:
+        results = list(pool.map(run_session, range(sessions), [iterations] * sessions, [github_url] * sessions))
+    # Wall time of the measured phase, from the barrier to the last session done
+    elapsed = max(r["finished"] for r in results) - min(r["started"] for r in results)
+    stop.set()
+    if watcher:
+        watcher.join()
+    if fake_github:
+        fake_github.stop()
+
+    latencies = [l for r in results for l in r["latencies"]]
+    cold_starts = [c for r in results for c in r["cold_starts"]]
+    exceptions = [e for r in results for e in r["exceptions"]]
+
+    corrupted = []
+    final = {}
+    for key in ("health", "tasks"):
+        try:
+            final[key] = _read_collection(key, fake_github)
+        except ValueError as e:
+            corrupted.append(str(e))
+            final[key] = []
+
+    saved_foods = {f["name"] for day in final["health"] for f in day.get("food_entries", [])}
+    saved_tasks = {t["name"] for t in final["tasks"]}
+    lost_foods = [n for r in results for n in r["expected_foods"] if n not in saved_foods]
+    lost_tasks = [n for r in results for n in r["expected_tasks"] if n not in saved_tasks]
+
+    return {
+        "mode": mode,
+        "backend": backend,
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(_percentile(latencies, 95) * 1000, 1),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 1) if latencies else 0.0,
+        "cold_start_s": round(sum(cold_starts) / sessions, 2),
+        "exceptions": len(exceptions),
+        "lost_updates": len(lost_foods) + len(lost_tasks),
+        "torn_reads": len(torn_reads),
+        "corrupted_files": corrupted,
+        "github_requests": fake_github.requests if fake_github else 0,
+        "github_conflicts": fake_github.conflicts if fake_github else 0,
+        "sample_exceptions": exceptions[:5],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=5, help="Journeys per session")
+    parser.add_argument("--mode", choices=["threads", "processes"], default="processes",
+                        help="threads serializes every rerun (AppTest is not thread-safe)")
+    parser.add_argument("--backend", choices=["local", "github"], default="local")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="Fraction of fake GitHub requests answered with a 502")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    with tempfile.TemporaryDirectory(prefix="lifetracker-load-") as tmp:
+        report = run_load(args.sessions, args.iterations, args.mode, args.backend,
+                          os.path.join(tmp, "data"), args.fail_rate)
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
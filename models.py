@@ -0,0 +1,124 @@
+import sys
+
+
+def _intern(value):
+    """Repeated short strings (dates, categories, action types) share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Records missing the same keys share one `absent` tuple (e.g. history written
+# before completed_date existed), instead of one tuple per record
+_ABSENT = {}
+
+
+class _Record:
+    """
+    Base for compact records. Subclasses list their JSON keys in FIELDS and
+    the ones worth interning in INTERNED. Unknown keys are kept in `extra` and
+    keys absent from the source in `absent`, so round-trips are lossless.
+    """
+    __slots__ = ("extra", "absent")
+    FIELDS = ()
+    INTERNED = ()
+
+    def __init__(self, **values):
+        for field in self.FIELDS:
+            setattr(self, field, values.pop(field, None))
+        self.extra = values or None
+        self.absent = None
+
+    @classmethod
+    def from_dict(cls, data):
+        record = cls.__new__(cls)
+        absent = []
+        for field in cls.FIELDS:
+            if field not in data:
+                absent.append(field)
+            value = data.get(field)
+            if field in cls.INTERNED:
+                value = _intern(value)
+            setattr(record, field, value)
+        extra = {k: v for k, v in data.items() if k not in cls.FIELDS}
+        record.extra = extra or None
+        if absent:
+            absent = tuple(absent)
+            absent = _ABSENT.setdefault(absent, absent)
+        record.absent = absent or None
+        return record
+
+    def to_dict(self):
+        absent = self.absent or ()
+        data = {field: getattr(self, field) for field in self.FIELDS if field not in absent}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+
+class FoodEntry(_Record):
+    __slots__ = ("name", "calories")
+    FIELDS = ("name", "calories")
+    INTERNED = ("name",)
+
+
+class HealthDay(_Record):
+    __slots__ = ("date", "food_entries", "workout_completed", "weight_log")
+    FIELDS = ("date", "food_entries", "workout_completed", "weight_log")
+    INTERNED = ("date",)
+
+    @classmethod
+    def from_dict(cls, data):
+        record = super().from_dict(data)
+        if isinstance(record.food_entries, list):
+            record.food_entries = [FoodEntry.from_dict(f) for f in record.food_entries]
+        return record
+
+    def to_dict(self):
+        data = super().to_dict()
+        if isinstance(data.get("food_entries"), list):
+            data["food_entries"] = [f.to_dict() for f in data["food_entries"]]
+        return data
+
+    @property
+    def total_calories(self):
+        return sum(f.calories for f in (self.food_entries or []))
+
+
+class Task(_Record):
+    __slots__ = ("name", "category", "status", "created_date", "completed_date")
+    FIELDS = ("name", "category", "status", "created_date", "completed_date")
+    INTERNED = ("category", "status", "created_date", "completed_date")
+
+
+class HistoryEvent(_Record):
+    __slots__ = ("timestamp", "action_type", "details")
+    FIELDS = ("timestamp", "action_type", "details")
+    INTERNED = ("action_type",)
+
+    @property
+    def completed_date(self):
+        """Day an archived task was done (TASK_COMPLETE only); kept in `extra`, not a slot every event pays for."""
+        return self.extra.get("completed_date") if self.extra else None
+
+
+RECORD_TYPES = {
+    "health": HealthDay,
+    "tasks": Task,
+    "history": HistoryEvent,
+}
+
+
+def to_records(key, data):
+    """JSON items (any iterable, e.g. a streaming parse) -> list of records for `key`."""
+    record_type = RECORD_TYPES[key]
+    return [record_type.from_dict(item) for item in data]
+
+
+def to_json(records):
+    """List of records -> the plain JSON schema stored on disk."""
+    return [record.to_dict() for record in records]
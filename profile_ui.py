@@ -81,8 +81,9 @@ def render_profile_page(manager):
                     "calorie_limit": calories,
                     "avatar_config": profile_data.get("avatar_config", {})
                 }
-                manager.save_data("profile", updated_data)
-                manager.log_action("PROFILE_UPDATE", f"Updated details for {new_name}")
+                with manager.batch():
+                    manager.save_data("profile", updated_data)
+                    manager.log_action("PROFILE_UPDATE", f"Updated details for {new_name}")
                 st.success("Profile Saved!")
                 st.rerun()
 
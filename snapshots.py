@@ -0,0 +1,306 @@
+import hashlib
+import json
+import os
+import threading
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, prune and create must not overlap
+    fcntl = None
+
+# Point-in-time copies of every DataManager file (local mode).
+#
+#   <DATA_DIR>/.snapshots/objects/ab/abcdef...   chunk contents, named by sha256
+#   <DATA_DIR>/.snapshots/manifests/<id>.json    per file: size, mtime, sha256, chunk list
+#   <DATA_DIR>/.snapshots/index.jsonl            one summary line per snapshot, for listing
+#   <DATA_DIR>/.snapshots/latest                 id of the newest snapshot (cheap check on every rerun)
+#
+# Files are cut into content-defined chunks at line ends (the JSON is written with
+# indent=4, one field per line), so appending to history or journal only adds the
+# last chunk or two. Files whose size and mtime match the previous snapshot are not
+# read at all: snapshot cost tracks what changed.
+
+SNAPSHOT_DIRNAME = ".snapshots"
+SNAPSHOT_INTERVAL = timedelta(hours=1)
+SNAPSHOT_KEEP = 24 * 7  # automatic snapshots keep a week of hourly history
+
+MIN_CHUNK = 2 * 1024
+MAX_CHUNK = 64 * 1024
+CUT_MASK = 0xFF  # one cut per ~256 lines: ~8 KB chunks for indent=4 JSON
+
+
+def _root(manager):
+    return os.path.join(manager.DATA_DIR, SNAPSHOT_DIRNAME)
+
+
+def _check_local(manager):
+    if manager.cloud_mode:
+        raise ValueError("Snapshots cover local mode only; Cloud Mode data is versioned by git")
+
+
+@contextmanager
+def _locked(root):
+    """
+    Serializes create and prune across sessions and processes: otherwise prune
+    could delete a chunk that a concurrent create found already stored and is
+    about to reference from its new manifest.
+    """
+    os.makedirs(root, exist_ok=True)
+    with open(os.path.join(root, "lock"), "w") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def _atomic_write(path, data):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# --- CHUNKING ---
+def iter_chunks(data):
+    """Splits bytes at line ends chosen by the line's content (and size bounds)."""
+    start = 0
+    line_start = 0
+    length = len(data)
+    while line_start < length:
+        nl = data.find(b"\n", line_start)
+        line_end = length if nl == -1 else nl + 1
+        size = line_end - start
+        if size >= MAX_CHUNK:
+            # One huge line (or no newlines): hard cut
+            cut = start + MAX_CHUNK
+            yield data[start:cut]
+            start = line_start = cut
+            continue
+        if size >= MIN_CHUNK and zlib.crc32(data[line_start:line_end]) & CUT_MASK == 0:
+            yield data[start:line_end]
+            start = line_end
+        line_start = line_end
+    if start < length:
+        yield data[start:]
+
+
+def _object_path(root, digest):
+    return os.path.join(root, "objects", digest[:2], digest)
+
+
+def _store_chunk(root, chunk):
+    """Writes a chunk unless an identical one is stored. Returns (digest, bytes_written)."""
+    digest = hashlib.sha256(chunk).hexdigest()
+    path = _object_path(root, digest)
+    if os.path.exists(path):
+        return digest, 0
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _atomic_write(path, chunk)
+    return digest, len(chunk)
+
+
+# --- SNAPSHOTS ---
+def _manifest_ids(root):
+    try:
+        names = os.listdir(os.path.join(root, "manifests"))
+    except FileNotFoundError:
+        return []
+    return sorted(n[:-5] for n in names if n.endswith(".json"))
+
+
+def load_manifest(manager, snapshot_id):
+    path = os.path.join(_root(manager), "manifests", f"{snapshot_id}.json")
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f"Unknown snapshot: {snapshot_id}")
+
+
+def create_snapshot(manager, force=False):
+    """
+    Snapshots every file in DataManager.FILES. Returns the index line for the new
+    snapshot, or None when nothing changed since the last one (unless `force`).
+    """
+    _check_local(manager)
+    root = _root(manager)
+    with _locked(root):
+        return _create_snapshot(manager, root, force)
+
+
+def _create_snapshot(manager, root, force):
+    ids = _manifest_ids(root)
+    previous = load_manifest(manager, ids[-1])["files"] if ids else {}
+
+    files = {}
+    changed = 0
+    new_bytes = 0
+    for key, filename in manager.FILES.items():
+        path = os.path.join(manager.DATA_DIR, filename)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+
+        prev = previous.get(key)
+        if prev and prev["size"] == stat.st_size and prev["mtime_ns"] == stat.st_mtime_ns:
+            files[key] = prev
+            continue
+
+        with open(path, "rb") as f:
+            data = f.read()
+        chunks = []
+        for chunk in iter_chunks(data):
+            digest, written = _store_chunk(root, chunk)
+            chunks.append(digest)
+            new_bytes += written
+        entry = {
+            "size": len(data),
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "chunks": chunks
+        }
+        if not prev or prev["sha256"] != entry["sha256"]:
+            changed += 1
+        files[key] = entry
+
+    if not changed and previous.keys() == files.keys() and not force:
+        return None
+
+    now = datetime.now()
+    snapshot_id = now.strftime("%Y%m%dT%H%M%S%f")
+    manifest = {"id": snapshot_id, "created": now.isoformat(), "files": files}
+    os.makedirs(os.path.join(root, "manifests"), exist_ok=True)
+    _atomic_write(os.path.join(root, "manifests", f"{snapshot_id}.json"),
+                  json.dumps(manifest).encode("utf-8"))
+
+    summary = {
+        "id": snapshot_id,
+        "created": manifest["created"],
+        "files_changed": changed,
+        "new_bytes": new_bytes,
+        "total_bytes": sum(e["size"] for e in files.values())
+    }
+    with open(os.path.join(root, "index.jsonl"), "a") as f:
+        f.write(json.dumps(summary) + "\n")
+    _atomic_write(os.path.join(root, "latest"), snapshot_id.encode("ascii"))
+    return summary
+
+
+def maybe_snapshot(manager, interval=SNAPSHOT_INTERVAL, keep=SNAPSHOT_KEEP):
+    """
+    Periodic hook, run on every app rerun: snapshots if the latest one is older
+    than `interval`, then prunes to the newest `keep`. The common case reads one
+    small file.
+    """
+    if manager.cloud_mode:
+        return None
+    root = _root(manager)
+    try:
+        with open(os.path.join(root, "latest"), "r") as f:
+            latest = f.read().strip()
+    except FileNotFoundError:
+        ids = _manifest_ids(root)
+        latest = ids[-1] if ids else None
+    if latest and datetime.now() - datetime.strptime(latest, "%Y%m%dT%H%M%S%f") < interval:
+        return None
+
+    summary = create_snapshot(manager)
+    if summary and keep:
+        prune_snapshots(manager, keep)
+    return summary
+
+
+def list_snapshots(manager):
+    """Index lines of snapshots that still exist, newest first."""
+    _check_local(manager)
+    root = _root(manager)
+    existing = set(_manifest_ids(root))
+    try:
+        with open(os.path.join(root, "index.jsonl"), "r") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+    return [s for s in reversed(lines) if s["id"] in existing]
+
+
+def restore_snapshot(manager, snapshot_id, keys=None):
+    """
+    Restores `keys` (default: all files) from a snapshot. The current state is
+    snapshotted first, so a restore can itself be undone. Derived files (streaks,
+    summary) are rebuilt afterwards. Returns the restored keys.
+    """
+    _check_local(manager)
+    root = _root(manager)
+    files = load_manifest(manager, snapshot_id)["files"]
+    keys = keys or list(files)
+    unknown = [k for k in keys if k not in files]
+    if unknown:
+        raise ValueError(f"Snapshot {snapshot_id} has no {', '.join(unknown)}")
+
+    # Assemble and verify everything before touching the data directory
+    contents = {}
+    for key in keys:
+        entry = files[key]
+        parts = []
+        for digest in entry["chunks"]:
+            with open(_object_path(root, digest), "rb") as f:
+                parts.append(f.read())
+        data = b"".join(parts)
+        if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Snapshot {snapshot_id} is damaged: {key} fails its checksum")
+        contents[key] = data
+
+    create_snapshot(manager)
+    for key, data in contents.items():
+        _atomic_write(os.path.join(manager.DATA_DIR, manager.FILES[key]), data)
+
+    # The files were replaced behind DataManager's back (and maybe only some of
+    # them), so derive the streak index and today's summary again from what is on disk
+    with manager.batch():
+        manager.rebuild_streaks()
+        manager._rebuild_summary()
+    return keys
+
+
+def prune_snapshots(manager, keep):
+    """Keeps the newest `keep` snapshots and deletes chunks no remaining snapshot uses."""
+    _check_local(manager)
+    root = _root(manager)
+    with _locked(root):
+        return _prune_snapshots(manager, root, keep)
+
+
+def _prune_snapshots(manager, root, keep):
+    ids = _manifest_ids(root)
+    doomed = ids[:-keep] if keep > 0 else ids
+    for snapshot_id in doomed:
+        os.remove(os.path.join(root, "manifests", f"{snapshot_id}.json"))
+
+    remaining = _manifest_ids(root)
+    live = set()
+    for snapshot_id in remaining:
+        for entry in load_manifest(manager, snapshot_id)["files"].values():
+            live.update(entry["chunks"])
+
+    # Keep the listing index and the latest marker in step with what is left
+    index_path = os.path.join(root, "index.jsonl")
+    if doomed and os.path.exists(index_path):
+        with open(index_path, "r") as f:
+            lines = [line for line in f if line.strip() and json.loads(line)["id"] in remaining]
+        _atomic_write(index_path, "".join(lines).encode("utf-8"))
+    if not remaining and os.path.exists(os.path.join(root, "latest")):
+        os.remove(os.path.join(root, "latest"))
+
+    removed = 0
+    objects = os.path.join(root, "objects")
+    for prefix in os.listdir(objects) if os.path.isdir(objects) else []:
+        for digest in os.listdir(os.path.join(objects, prefix)):
+            if digest not in live:
+                os.remove(os.path.join(objects, prefix, digest))
+                removed += 1
+    return {"snapshots_removed": len(doomed), "chunks_removed": removed}
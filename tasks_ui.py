@@ -1,5 +1,7 @@
 import streamlit as st
 
+from fragments import rerun_fragment
+
 def render_tasks_page(manager):
     st.header("Task Tracker")
 
@@ -19,6 +21,14 @@ def render_tasks_page(manager):
                 st.rerun()
 
     # --- DISPLAY SECTION ---
+    _render_agenda(manager)
+
+@st.fragment
+def _render_agenda(manager):
+    """
+    Task lists and cleanup as one fragment: a checkbox tick reruns only this
+    section, with its own read of the task list.
+    """
     tasks = manager.load_data("tasks")
     
     # Separate lists for display (not by modifying the original list in place yet)
@@ -44,7 +54,7 @@ def render_tasks_page(manager):
         count = manager.archive_completed_tasks()
         if count > 0:
             st.success(f"Archived {count} tasks!")
-            st.rerun()
+            rerun_fragment()
         else:
             st.info("No completed tasks to clear.")
 
@@ -74,4 +84,4 @@ def _render_task_list(manager, all_tasks, category_filter):
             if checked != is_done:
                 new_status = "Done" if checked else "Pending"
                 manager.update_task_status(i, new_status)
-                st.rerun()
+                rerun_fragment()
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+# The modules live at the repository root, not in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_manager import DataManager  # noqa: E402
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """A local-mode DataManager on an empty data directory."""
+    monkeypatch.setattr(DataManager, "DATA_DIR", str(tmp_path / "data"))
+    return DataManager()
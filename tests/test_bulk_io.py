@@ -0,0 +1,47 @@
+import io
+
+import pytest
+
+import bulk_io
+
+
+def rows(text):
+    return bulk_io.iter_rows(io.StringIO(text), "csv")
+
+
+@pytest.mark.parametrize("csv_text, error", [
+    ("date,weight\n2026-10-01,nan\n", "finite"),
+    ("date,calories\n2026-10-01,inf\n", "finite"),
+    ("date,calories\n2026-10-01,-5\n", "positive"),
+    ("date,weight\n2026-10-01,0\n", "positive"),
+    ("date,calories\n01-10-2026,300\n", "date"),
+])
+def test_import_health_rejects_bad_values(manager, csv_text, error):
+    with pytest.raises(ValueError, match=error):
+        bulk_io.import_health(manager, rows(csv_text))
+    assert manager.load_data("health") == []
+
+
+def test_import_health_keeps_unnamed_daily_totals(manager):
+    stats = bulk_io.import_health(manager, rows("date,kcal\n2026-10-01,1800\n"))
+
+    assert stats["foods"] == 1
+    assert manager.load_data("health")[0]["food_entries"] == [{"name": "Daily total", "calories": 1800}]
+    # Re-importing is a no-op
+    assert bulk_io.import_health(manager, rows("date,kcal\n2026-10-01,1800\n"))["skipped"] == 1
+
+
+def test_import_tasks_maps_categories_and_status(manager):
+    stats = bulk_io.import_tasks(manager, rows(
+        "name,project,status,created\n"
+        "A,Personal,Completed,2026-10-01\n"
+        "B,work,open,2026-10-01\n"
+        "C,School,x,2026-10-02\n"))
+
+    assert stats == {"tasks": 3, "skipped": 0, "recategorized": 1}
+    tasks = {t["name"]: t for t in manager.load_data("tasks")}
+    assert tasks["A"]["category"] == "Daily Goal"
+    assert tasks["A"]["status"] == "Done"
+    assert tasks["A"]["completed_date"] == "2026-10-01"
+    assert (tasks["B"]["category"], tasks["B"]["status"]) == ("Work", "Pending")
+    assert (tasks["C"]["category"], tasks["C"]["status"]) == ("Study", "Done")
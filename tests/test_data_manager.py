@@ -0,0 +1,93 @@
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from data_manager import DataManager
+
+
+@pytest.mark.parametrize("key", ["health", "tasks", "history"])
+def test_truncated_file_reads_as_empty(manager, key):
+    manager.add_food_log("2026-10-01", "Idly", 300)
+    manager.add_task("Read", "Study")
+    path = os.path.join(DataManager.DATA_DIR, DataManager.FILES[key])
+    with open(path, "r") as f:
+        text = f.read()
+    with open(path, "w") as f:
+        f.write(text[:len(text) // 2])
+
+    assert manager.load_data(key) == []
+    assert manager.load_records(key) == []
+    with pytest.raises(ValueError):
+        list(manager.iter_data(key))
+
+    # Pages and helpers that read records keep working
+    manager.get_weight_history()
+    manager.get_monthly_analytics(2026, 10)
+    manager.rebuild_streaks()
+
+
+def _mtimes():
+    return {name: os.stat(os.path.join(DataManager.DATA_DIR, name)).st_mtime_ns
+            for name in os.listdir(DataManager.DATA_DIR)}
+
+
+def test_home_reads_never_write(manager):
+    today = datetime.now().strftime("%Y-%m-%d")
+    manager.add_food_log(today, "Idly", 300)
+    manager.set_workout_status(today, True)
+    # Yesterday's summary and no streak index, as on the first view of a day after upgrading
+    for key, stale in (("summary", '{"date": "2000-01-01"}'), ("streaks", "{}")):
+        with open(os.path.join(DataManager.DATA_DIR, DataManager.FILES[key]), "w") as f:
+            f.write(stale)
+    before = _mtimes()
+
+    summary = manager.get_today_summary()
+    streaks = manager.get_streaks(summary)
+
+    assert _mtimes() == before
+    assert summary["date"] == today and summary["calories_consumed"] == 300
+    assert streaks["workout"]["current"] == 1
+
+    # The next mutating batch persists both
+    manager.add_journal_entry("Good day", "Logged lunch.")
+    assert manager.load_data("summary")["date"] == today
+    assert "metrics" in manager.load_data("streaks")
+    assert manager.get_today_summary()["streaks"]["workout"]["run"] == 1
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_streaks_match_a_rebuild(manager, seed):
+    rng = random.Random(seed)
+    today = datetime.now()
+    days = [(today - timedelta(days=n)).strftime("%Y-%m-%d") for n in range(20)]
+
+    for _ in range(60):
+        op = rng.randrange(7)
+        if op == 0:
+            manager.add_food_log(rng.choice(days), "Meal", rng.choice([0, 400, 900, 1600]))
+        elif op == 1:
+            manager.set_workout_status(rng.choice(days), rng.random() < 0.6)
+        elif op == 2:
+            manager.add_task(f"Task {rng.randrange(1000)}", "Work")
+        elif op == 3 and manager.load_data("tasks"):
+            index = rng.randrange(len(manager.load_data("tasks")))
+            manager.update_task_status(index, rng.choice(["Done", "Pending"]))
+        elif op == 4 and rng.random() < 0.3:
+            manager.archive_completed_tasks()
+        elif op == 5:
+            manager.set_streak_gap(rng.choice(DataManager.STREAK_METRICS), rng.randrange(3))
+        elif op == 6 and rng.random() < 0.3:
+            profile = manager.load_data("profile")
+            profile["calorie_limit"] = rng.choice([1000, 1500, 2000])
+            manager.save_data("profile", profile)
+        else:
+            continue
+
+        index = manager.load_data("streaks")
+        rebuilt = manager._compute_streak_index()
+        assert index == rebuilt
+        mirrored = {"date": today.strftime("%Y-%m-%d")}
+        manager._apply_to_summary(mirrored, "streaks", rebuilt)
+        assert manager.load_data("summary")["streaks"] == mirrored["streaks"]
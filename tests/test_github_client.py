@@ -0,0 +1,162 @@
+import pytest
+
+import github_client
+from data_manager import DataManager
+from fake_github import FakeGitHub
+from github_client import GitHubClient, GitHubError, RateLimitExceeded
+
+PATH = "data/tasks.json"
+
+
+@pytest.fixture
+def fake():
+    server = FakeGitHub().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Records retry delays instead of sleeping through them."""
+    delays = []
+    monkeypatch.setattr(github_client.time, "sleep", delays.append)
+    return delays
+
+
+def make_client(fake, **kwargs):
+    return GitHubClient("token", "owner/repo", api_url=fake.url, **kwargs)
+
+
+def test_not_modified_returns_cached_content(fake):
+    sha = fake.set_file(PATH, "[1, 2]")
+    client = make_client(fake)
+
+    assert client.get_file(PATH) == ("[1, 2]", sha)
+    remaining = fake.remaining
+    assert client.get_file(PATH) == ("[1, 2]", sha)
+
+    assert client.stats["not_modified"] == 1
+    assert fake.remaining == remaining  # a 304 is free
+
+
+def test_put_file_caches_sha_then_refreshes_etag(fake):
+    client = make_client(fake)
+
+    sha = client.put_file(PATH, "[]", "Init tasks")
+    assert client.known_sha(PATH) == sha == fake.files[PATH][1]
+
+    # No ETag for the new version yet: one full read, then conditional hits
+    assert client.get_file(PATH) == ("[]", sha)
+    assert client.stats["not_modified"] == 0
+    assert client.get_file(PATH) == ("[]", sha)
+    assert client.stats["not_modified"] == 1
+
+    # Someone else's write invalidates the ETag
+    new_sha = fake.set_file(PATH, "[3]")
+    assert client.get_file(PATH) == ("[3]", new_sha)
+    assert client.stats["not_modified"] == 1
+
+
+def test_retries_server_errors_honouring_retry_after(fake, sleeps):
+    fake.set_file(PATH, "[]")
+    fake.fail_next(503, headers={"Retry-After": "2"})
+    fake.fail_next(502)
+    client = make_client(fake, backoff=0.01)
+
+    assert client.get_file(PATH)[0] == "[]"
+    assert client.stats == {"requests": 3, "not_modified": 0, "retries": 2, "failures": 0}
+    assert sleeps[0] == 2.0
+    assert 0 <= sleeps[1] <= 0.04
+
+
+def test_gives_up_after_max_retries(fake, sleeps):
+    fake.fail_next(502, times=3)
+    client = make_client(fake, max_retries=2)
+
+    with pytest.raises(GitHubError) as exc:
+        client.get_file(PATH)
+    assert exc.value.status == 502
+    assert client.stats["retries"] == 2
+    assert client.stats["failures"] == 1
+    assert fake.requests == 3
+
+
+def test_client_errors_are_not_retried(fake, sleeps):
+    fake.fail_next(401, "Bad credentials")
+    client = make_client(fake)
+
+    with pytest.raises(GitHubError) as exc:
+        client.get_file(PATH)
+    assert exc.value.status == 401
+    assert client.stats["failures"] == 1
+    assert sleeps == []
+
+
+def test_stops_at_reserve(fake):
+    fake.remaining = 3
+    fake.set_file(PATH, "[]")
+    client = make_client(fake, reserve=1)
+
+    client.get_file("data/a.json")  # 404, 2 left
+    client.get_file("data/b.json")  # 404, 1 left
+    with pytest.raises(RateLimitExceeded):
+        client.get_file(PATH)
+    assert fake.requests == 2  # the budget check never hit the network
+
+
+def test_exhausted_rate_limit_raises(fake, sleeps):
+    fake.remaining = 0
+    fake.fail_next(403, "API rate limit exceeded")
+    client = make_client(fake, reserve=0)
+
+    with pytest.raises(RateLimitExceeded):
+        client.get_file(PATH)
+    assert sleeps == []
+
+
+def cloud_manager(fake, tmp_path, monkeypatch):
+    monkeypatch.setattr(DataManager, "DATA_DIR", str(tmp_path))
+    manager = DataManager()
+    manager.cloud_mode = True
+    manager.client = make_client(fake, max_retries=1)
+    return manager
+
+
+def test_save_to_cloud_refuses_to_overwrite_a_conflict(fake, tmp_path, monkeypatch):
+    manager = cloud_manager(fake, tmp_path, monkeypatch)
+    path = "data/journal.json"
+    fake.set_file(path, "[]")
+    manager.load_data("journal")
+    theirs = '[{"title": "from another tab"}]'
+    fake.set_file(path, theirs)  # our sha is now stale
+
+    with pytest.raises(GitHubError) as exc:
+        manager.save_data("journal", [{"title": "mine"}])
+
+    assert exc.value.status == 409
+    assert fake.files[path][0] == theirs
+    # The next read picks up the other session's version
+    assert manager.load_data("journal") == [{"title": "from another tab"}]
+
+
+def test_failed_cloud_read_never_writes_defaults(fake, tmp_path, monkeypatch, sleeps):
+    manager = cloud_manager(fake, tmp_path, monkeypatch)
+    path = "data/health.json"
+    fake.set_file(path, '[{"date": "2026-10-01", "food_entries": []}]')
+    before = fake.files[path]
+    fake.fail_next(502, times=2)
+
+    with pytest.raises(GitHubError):
+        manager.add_food_log("2026-10-02", "Idly", 300)
+    assert fake.files[path] == before
+
+
+def test_session_client_follows_token(monkeypatch):
+    import streamlit
+    monkeypatch.setattr(streamlit, "session_state", {})
+    manager = DataManager.__new__(DataManager)
+
+    first = manager._session_client("old", "owner/repo", "main", "http://fake")
+    assert manager._session_client("old", "owner/repo", "main", "http://fake") is first
+    rotated = manager._session_client("new", "owner/repo", "main", "http://fake")
+    assert rotated is not first and rotated.token == "new"
@@ -0,0 +1,86 @@
+import http.client
+import json
+import threading
+from http.server import HTTPServer
+
+import pytest
+
+import ingest
+import lifetracker
+
+
+@pytest.mark.parametrize("event, error", [
+    ({"type": "weight", "weight": "nan"}, "finite"),
+    ({"type": "weight", "weight": float("inf")}, "finite"),
+    ({"type": "weight", "weight": -80}, "positive"),
+    ({"type": "food", "name": "Idly", "calories": "1e999"}, "finite"),
+    ({"type": "food", "name": "Idly", "calories": "lots"}, "number"),
+    ({"type": "food", "name": "Idly", "calories": 300, "date": "2026-13-01"}, "date"),
+    ({"type": "food", "calories": 300}, "name"),
+    ({"type": "task", "name": "Read", "category": "Personal"}, "category"),
+    ({"type": "sleep"}, "Unknown event"),
+])
+def test_invalid_events_are_rejected(manager, event, error):
+    with pytest.raises(ValueError, match=error):
+        ingest.apply_events(manager, [event])
+
+
+def test_batch_is_all_or_nothing(manager):
+    events = [
+        {"type": "food", "name": "Idly", "calories": 300, "date": "2026-10-01"},
+        {"type": "task", "name": "Read", "category": "Study"},
+        {"type": "weight", "weight": "nan"},
+    ]
+    with pytest.raises(ValueError):
+        ingest.apply_events(manager, events)
+
+    assert manager.load_data("health") == []
+    assert manager.load_data("tasks") == []
+    assert manager.load_data("history") == []
+
+    assert ingest.apply_events(manager, events[:2]) == 2
+    assert manager.load_data("health")[0]["food_entries"] == [{"name": "Idly", "calories": 300}]
+
+
+def test_cli_exits_1_on_invalid_input(manager, capsys):
+    data_dir = manager.DATA_DIR
+    assert lifetracker.main(["--data-dir", data_dir, "weight", "nan"]) == 1
+    assert lifetracker.main(["--data-dir", data_dir, "food", "Idly", "300", "--date", "01/10/2026"]) == 1
+    assert "lifetracker:" in capsys.readouterr().err
+    assert lifetracker.main(["--data-dir", data_dir, "weight", "82.4"]) == 0
+    assert manager.load_data("profile")["current_weight"] == 82.4
+
+
+@pytest.fixture
+def server(manager):
+    handler = type("TestHandler", (ingest.IngestHandler,), {"manager": manager, "token": None,
+                                                           "log_message": lambda *args: None})
+    httpd = HTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def post(port, path, body):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+    resp = conn.getresponse()
+    return resp.status, json.loads(resp.read())
+
+
+@pytest.mark.parametrize("body", [
+    b'{"type": "weight", "weight": NaN}',
+    b'{"type": "food", "name": "Idly", "calories": 300, "date": "yesterday"}',
+    b'\xff\xfe not utf-8',
+    b'{not json',
+])
+def test_http_rejects_bad_requests_with_400(manager, server, body):
+    status, reply = post(server, "/log", body)
+    assert status == 400 and reply["ok"] is False
+    assert manager.load_data("health") == []
+
+
+def test_http_accepts_a_batch(manager, server):
+    body = b'{"type": "food", "name": "Idly", "calories": 300}\n{"type": "task", "name": "Read"}\n'
+    assert post(server, "/batch", body) == (200, {"ok": True, "count": 2})
@@ -0,0 +1,149 @@
+import json
+import os
+import random
+import threading
+
+import pytest
+
+import snapshots
+from data_manager import DataManager
+
+
+def lines_blob(count, seed=0):
+    rng = random.Random(seed)
+    return "".join(f'    "entry {i}": {rng.randrange(10 ** 6)},\n' for i in range(count)).encode()
+
+
+def test_chunks_cover_the_data_within_bounds():
+    data = lines_blob(20000)
+    chunks = list(snapshots.iter_chunks(data))
+
+    assert b"".join(chunks) == data
+    assert len(chunks) > 1
+    assert all(len(c) <= snapshots.MAX_CHUNK for c in chunks)
+    assert all(len(c) >= snapshots.MIN_CHUNK for c in chunks[:-1])
+    assert all(c.endswith(b"\n") for c in chunks[:-1])
+
+
+def test_chunks_hard_cut_a_file_without_newlines():
+    data = b"x" * (snapshots.MAX_CHUNK * 2 + 10)
+    assert [len(c) for c in snapshots.iter_chunks(data)] == [snapshots.MAX_CHUNK, snapshots.MAX_CHUNK, 10]
+
+
+def test_chunk_boundaries_resync_after_an_insert():
+    data = lines_blob(20000)
+    edited = data[:100] + b'    "inserted": 1,\n' + data[100:]
+
+    before = set(snapshots.iter_chunks(data))
+    after = list(snapshots.iter_chunks(edited))
+    # Only the chunk holding the edit is new
+    assert sum(c not in before for c in after) == 1
+
+
+def test_unchanged_files_are_not_snapshotted_again(manager):
+    manager.add_food_log("2026-10-01", "Idly", 300)
+    first = snapshots.create_snapshot(manager)
+
+    assert first["files_changed"] == len(DataManager.FILES)
+    assert snapshots.create_snapshot(manager) is None
+    assert snapshots.create_snapshot(manager, force=True)["new_bytes"] == 0
+
+
+def test_appending_stores_only_new_chunks(manager):
+    for day in range(1, 29):
+        for n in range(40):
+            manager.log_action("FOOD_LOG", f"Logged meal {day}-{n}")
+    snapshots.create_snapshot(manager)
+
+    manager.log_action("FOOD_LOG", "One more")
+    second = snapshots.create_snapshot(manager)
+
+    assert second["files_changed"] == 1
+    assert second["new_bytes"] < second["total_bytes"] / 10
+
+
+def test_restore_brings_back_data_and_derived_files(manager):
+    today = manager.get_today_summary()["date"]
+    manager.add_food_log(today, "Idly", 300)
+    snapshot_id = snapshots.create_snapshot(manager)["id"]
+    manager.add_food_log(today, "Dosa", 500)
+    manager.set_workout_status(today, True)
+
+    assert snapshots.restore_snapshot(manager, snapshot_id, ["health"]) == ["health"]
+
+    assert [f["name"] for f in manager.find_health_entry(today)["food_entries"]] == ["Idly"]
+    assert manager.get_today_summary()["calories_consumed"] == 300
+    assert manager.get_streaks()["workout"]["current"] == 0
+    # The state before the restore was snapshotted, so the restore can be undone
+    assert len(snapshots.list_snapshots(manager)) == 2
+
+
+def test_restore_refuses_a_damaged_snapshot(manager):
+    manager.add_food_log("2026-10-01", "Idly", 300)
+    snapshot_id = snapshots.create_snapshot(manager)["id"]
+    digest = snapshots.load_manifest(manager, snapshot_id)["files"]["health"]["chunks"][0]
+    with open(snapshots._object_path(snapshots._root(manager), digest), "ab") as f:
+        f.write(b"garbage")
+    manager.add_food_log("2026-10-02", "Dosa", 500)
+
+    with pytest.raises(ValueError, match="checksum"):
+        snapshots.restore_snapshot(manager, snapshot_id)
+    assert len(manager.load_data("health")) == 2
+
+
+def test_prune_keeps_newest_snapshots_restorable(manager):
+    ids = []
+    for day in range(1, 5):
+        manager.add_food_log(f"2026-10-0{day}", "Idly", 300)
+        ids.append(snapshots.create_snapshot(manager)["id"])
+
+    result = snapshots.prune_snapshots(manager, keep=2)
+
+    assert result["snapshots_removed"] == 2
+    assert [s["id"] for s in snapshots.list_snapshots(manager)] == ids[:1:-1]
+    with open(os.path.join(snapshots._root(manager), "index.jsonl")) as f:
+        assert [json.loads(line)["id"] for line in f] == ids[2:]
+    snapshots.restore_snapshot(manager, ids[2])
+    assert len(manager.load_data("health")) == 3
+
+
+def test_maybe_snapshot_respects_interval_and_retention(manager, monkeypatch):
+    assert snapshots.maybe_snapshot(manager) is not None
+    manager.add_food_log("2026-10-01", "Idly", 300)
+    # Within the interval only the marker is read
+    with monkeypatch.context() as m:
+        m.setattr(snapshots, "_manifest_ids", lambda root: pytest.fail("listed manifests"))
+        assert snapshots.maybe_snapshot(manager) is None
+
+    for n in range(3):
+        manager.add_food_log("2026-10-01", f"Snack {n}", 100)
+        snapshots.maybe_snapshot(manager, interval=snapshots.timedelta(0), keep=2)
+    assert len(snapshots.list_snapshots(manager)) == 2
+
+
+def test_prune_and_create_do_not_interleave(manager):
+    manager.add_food_log("2026-10-01", "Idly", 300)
+    snapshots.create_snapshot(manager)
+    errors = []
+
+    def churn(action):
+        try:
+            for n in range(15):
+                action(n)
+        except Exception as e:
+            errors.append(e)
+
+    def create(n):
+        manager.log_action("FOOD_LOG", f"meal {n}")
+        snapshots.create_snapshot(manager, force=True)
+
+    threads = [threading.Thread(target=churn, args=(create,)),
+               threading.Thread(target=churn, args=(lambda n: snapshots.prune_snapshots(manager, keep=1),))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    for snap in snapshots.list_snapshots(manager):
+        snapshots.restore_snapshot(manager, snap["id"])